@@ -9,7 +9,6 @@ import sys
 from pathlib import Path
 from dotenv import load_dotenv
 import os
-import dspy
 import tempfile
 import subprocess
 
@@ -18,8 +17,6 @@ from rich.panel import Panel
 from rich.prompt import Prompt, Confirm
 from rich.markdown import Markdown
 
-from columbo.debug_loop import debug_loop
-from columbo.ui import ColumboUI
 from columbo.session_utils import (
     save_session_to_file,
     generate_session_report,
@@ -37,6 +34,9 @@ def setup_dspy_llm(api_key: str, model: str, seed: int = None):
         model: Model name (e.g., 'openai/gpt-4')
         seed: Optional random seed for reproducible outputs
     """
+    # Imported here so `columbo --help` and argument errors don't pay for loading dspy
+    import dspy
+    
     # gpt-5 models only support temperature=1
     # For other models that support it, 0.0 would be more deterministic
     temperature = 1.0 if "gpt-5" in model else 0.0
@@ -425,9 +425,14 @@ def run_debug(args: argparse.Namespace) -> int:
     if args.interactive:
         console.print("\n[bold cyan]🕵️  Starting interactive UI mode...[/bold cyan]")
         console.print("[dim]⚠️  UI will take over the screen. Press Ctrl+C to stop.[/dim]\n")
+        # Imported here so non-interactive runs skip loading Rich's live/layout stack
+        from columbo.ui import ColumboUI
         ui = ColumboUI(max_steps=args.max_steps, verbose=False)
         ui.start()
     
+    # Imported here (not at module level) so the CLI starts without loading the agent stack
+    from columbo.debug_loop import debug_loop
+    
     # Run debugging loop
     try:
         result = debug_loop(
@@ -1,5 +1,7 @@
+import functools
+from concurrent.futures import ThreadPoolExecutor
 import json
-import docker
+import time
 from datetime import datetime
 from typing import Optional
 from columbo.modules import (
@@ -12,7 +14,7 @@ from columbo.modules import (
     ProbePlanningInput,
     EvidenceDigestInput,
 )
-from columbo.probes import probe_registry, PROBE_DEPENDENCIES, build_tools_spec, validate_probe_args, PROBE_SCHEMAS
+from columbo.probes import probe_registry, build_tools_spec, validate_probe_args, PROBE_SCHEMAS
 from columbo.probes import sanitize_probe_args
 from columbo.probes.runtime import invoke_with_container_resolution
 from columbo.probes.spec import PROBES
@@ -32,7 +34,15 @@ from columbo.tracing import (
 )
 from pathlib import Path
 import uuid
-from typing import Dict, Any, Optional, List
+
+# orjson is optional: it formats large probe results much faster than stdlib json
+try:
+    import orjson
+    ORJSON_AVAILABLE = True
+except ImportError:
+    ORJSON_AVAILABLE = False
+from types import MappingProxyType
+from typing import Callable, Dict, Any, Optional, List, Mapping, Tuple
 
 
 # Derive container probe categories from metadata (single source of truth)
@@ -48,8 +58,37 @@ _SINGLE_CONTAINER_PROBES = {
     if spec.scope == "container" and "container" in spec.required_args
 }
 
-# All container probes (union of both categories)
-_ALL_CONTAINER_PROBES = _MULTI_CONTAINER_PROBES | _SINGLE_CONTAINER_PROBES
+# Evidence passed to the LLM after each step: problem, session progress, probes run, findings
+_EVIDENCE_TEMPLATE = (
+    "{initial_problem}\n\n"
+    "--- Debug Session Info ---\n"
+    "Steps used: {steps_used}/{max_steps}\n"
+    "Steps remaining: {steps_remaining}\n"
+    "Note: {note}\n\n"
+    "--- Previously Executed Probes ---\n"
+    "{probes_summary}\n\n"
+    "--- Evidence Gathered ---\n\n"
+    "{all_findings}"
+)
+_NOTE_CONCLUDE = "Focus on concluding and proposing fixes."
+_NOTE_CONTINUE = "Continue investigating systematically."
+
+# Upper bound on the prior-findings context passed to evidence_digest
+_PRIOR_DIGEST_MAX_CHARS = 4000
+
+# How long (seconds) a successful result may be reused for the same probe + args.
+# Probes not listed (logs, exec, tcp/http) always run: their output is expected to change.
+_PROBE_MEMO_TTL_SECONDS = {
+    "config_files_detection": 300,
+    "env_files_parsing": 300,
+    "docker_compose_parsing": 300,
+    "generic_config_parsing": 300,
+    "containers_state": 60,
+    "containers_ports": 60,
+    "container_inspect": 60,
+    "container_mounts": 60,
+    "dns_resolution": 30,
+}
 
 
 class DebugContext:
@@ -65,7 +104,16 @@ class DebugContext:
         self.session = session
         self.container_cache = ContainerCache()
         self.probe_results_cache: Dict[str, Any] = {}
+        # (probe_name, canonical args) -> (monotonic timestamp, result)
+        self.probe_memo: Dict[Tuple[str, str], Tuple[float, Any]] = {}
         self.evidence_log: List[str] = []
+        # evidence_log joined with blank lines, extended on each add_evidence()
+        self.evidence_text = ""
+    
+    def add_evidence(self, entry: str):
+        """Append an entry to the evidence log and its joined text."""
+        self.evidence_log.append(entry)
+        self.evidence_text = f"{self.evidence_text}\n\n{entry}" if self.evidence_text else entry
     
     def vprint(self, *args, **kwargs):
         """Context-aware verbose print."""
@@ -79,6 +127,8 @@ class ContainerCache:
         self.containers = None
         self.client = None
         self.discovered = False
+        # Name -> Container index built once at discovery, for O(1) lookups
+        self.by_name: Dict[str, Any] = {}
     
     def discover(self, context: Optional['DebugContext'] = None):
         """Discover all Docker containers on the local system.
@@ -90,8 +140,17 @@ class ContainerCache:
             return self.containers, self.client
         
         try:
+            # Imported on first discovery so sessions that never touch containers don't load docker
+            import docker
+
             self.client = docker.from_env()
-            self.containers = self.client.containers.list(all=True)
+            # containers.list() inspects each container one request at a time; list sparsely
+            # and run the per-container inspects concurrently instead (order is preserved)
+            listed = self.client.containers.list(all=True, sparse=True)
+            with ThreadPoolExecutor(max_workers=max(1, min(8, len(listed)))) as pool:
+                inspected = list(pool.map(self._inspect, listed))
+            self.containers = [c for c in inspected if c is not None]
+            self.by_name = {c.name: c for c in self.containers}
             self.discovered = True
             if context:
                 context.vprint(f"Discovered {len(self.containers)} Docker containers")
@@ -103,21 +162,38 @@ class ContainerCache:
             self.discovered = True
         
         return self.containers, self.client
+    
+    def _inspect(self, sparse_container):
+        """Fetch full attrs for a container from a sparse listing (None if it was removed)."""
+        from docker.errors import NotFound
+
+        try:
+            return self.client.containers.get(sparse_container.id)
+        except NotFound:
+            return None
+    
+    def get(self, name: str):
+        """Return the discovered container with this exact name, or None."""
+        return self.by_name.get(name)
 
 
-def parse_probe_args(probe_args_str: str) -> dict:
-    """Parse probe arguments from string to dict.
+@functools.lru_cache(maxsize=256)
+def parse_probe_args(probe_args_str: str) -> Mapping[str, Any]:
+    """Parse probe arguments from string to a read-only mapping.
+    
+    Results are memoized on the raw string (the same args string is parsed
+    several times per step), so callers must copy before mutating.
     
     Args:
         probe_args_str: JSON-like string from the LLM
         
     Returns:
-        dict: Parsed arguments
+        Mapping: Parsed arguments (read-only view)
     """
     try:
         # Try to parse as JSON
         args = json.loads(probe_args_str)
-        return args if isinstance(args, dict) else {}
+        return MappingProxyType(args if isinstance(args, dict) else {})
     except json.JSONDecodeError:
         # If JSON parsing fails, try to extract key-value pairs
         # This handles cases where the LLM returns something like "container=api, tail=100"
@@ -136,7 +212,7 @@ def parse_probe_args(probe_args_str: str) -> dict:
                     args[key] = value
         except Exception:
             pass
-        return args
+        return MappingProxyType(args)
 
 
 def resolve_probe_dependencies(
@@ -144,41 +220,56 @@ def resolve_probe_dependencies(
     args: dict,
     probe_results_cache: dict,
     workspace_root: Optional[str],
-    context: Optional['DebugContext'] = None
+    context: Optional['DebugContext'] = None,
+    _resolving: Tuple[str, ...] = ()
 ) -> dict:
     """Resolve dependencies for a probe using declarative configuration.
     
+    A missing prerequisite is auto-executed after its own prerequisites
+    (depth-first), so chains of `requires` resolve in dependency order.
+    
     Args:
         probe_name: Name of the probe being executed
         args: Current arguments for the probe
         probe_results_cache: Cache of previous probe results
         workspace_root: Workspace root path
         context: Optional debug context for verbose output
+        _resolving: Probes already being resolved further up the chain (cycle guard)
         
     Returns:
         dict: Updated arguments with resolved dependencies
     """
-    if probe_name not in PROBE_DEPENDENCIES:
+    # Read the typed spec directly rather than the backward-compatible PROBE_DEPENDENCIES dicts
+    spec = PROBES.get(probe_name)
+    if spec is None or spec.requires is None:
+        return args
+    
+    required_probe = spec.requires
+    
+    # Caller already supplied everything the dependency would produce
+    if spec.provides and all(args.get(key) for key in spec.provides):
+        if context:
+            context.vprint(f"  → Arguments already provided, skipping '{required_probe}'")
         return args
     
-    dep_config = PROBE_DEPENDENCIES[probe_name]
-    required_probe = dep_config["requires"]
+    if required_probe in _resolving:
+        if context:
+            context.vprint(f"  → Dependency cycle through '{required_probe}', not auto-executing")
+        return args
     
     # Check if dependency was already run
     if required_probe not in probe_results_cache:
         if context:
             context.vprint(f"  → Dependency '{required_probe}' not found, auto-executing...")
         
-        # Auto-execute the required probe
-        required_func = probe_registry[required_probe]
-        if required_probe == "config_files_detection":
-            result = required_func(
-                root_path=workspace_root or ".",
-                probe_name=required_probe,
-                max_depth=3
-            )
-        else:
-            result = required_func(probe_name=required_probe)
+        # Auto-execute the required probe with default args, after its own prerequisites
+        required_args = resolve_probe_dependencies(
+            required_probe, {}, probe_results_cache, workspace_root, context,
+            _resolving + (probe_name,)
+        )
+        container_cache = context.container_cache if context else ContainerCache()
+        handler = _PROBE_HANDLERS.get(required_probe, _run_generic_probe)
+        result = handler(required_probe, required_args, container_cache, workspace_root, context)
         
         probe_results_cache[required_probe] = result
         if context:
@@ -199,11 +290,10 @@ def resolve_probe_dependencies(
         # Fallback: try to convert to dict via model_dump if it's a Pydantic model
         result_dict = cached_result.model_dump() if hasattr(cached_result, 'model_dump') else cached_result
     
-    transformed = dep_config["transform"](result_dict)
+    transformed = spec.transform(result_dict)
     
-    file_count = len(transformed.get("found_files", []))
     if context:
-        context.vprint(f"  → Resolved to {file_count} files")
+        context.vprint(f"  → Resolved to {len(transformed.get('found_files', []))} files")
     
     # Merge transformed data into args (don't override if explicitly provided)
     for key, value in transformed.items():
@@ -251,10 +341,8 @@ def execute_probe(
             "probe_name": probe_name,
         }
     
-    probe_func = probe_registry[probe_name]
-    
     # Parse arguments
-    args = parse_probe_args(probe_args_str)
+    args = dict(parse_probe_args(probe_args_str))
     
     # Sanitize arguments (remove LLM-provided dependencies, normalize aliases)
     args = sanitize_probe_args(probe_name, args)
@@ -271,49 +359,23 @@ def execute_probe(
             "provided_args": list(args.keys()),
         }
     
+    # Reuse a recent result for the same probe + resolved args (key order/spelling independent)
+    memo_key = None
+    ttl = _PROBE_MEMO_TTL_SECONDS.get(probe_name, 0)
+    if context and ttl:
+        memo_key = (probe_name, json.dumps(args, sort_keys=True, default=str))
+        memoized = context.probe_memo.get(memo_key)
+        if memoized and time.monotonic() - memoized[0] < ttl:
+            context.vprint(f"  → Reusing result from an identical '{probe_name}' call")
+            return memoized[1]
+    
     try:
-        # Discover containers if needed for container-scoped probes
-        containers, client = None, None
-        if probe_name in _ALL_CONTAINER_PROBES:
-            containers, client = container_cache.discover(context)
-            if not containers:
-                return {
-                    "error": "No containers available or failed to connect to Docker",
-                    "probe_name": probe_name
-                }
-        
-        # Handle different probe types
-        if probe_name in _MULTI_CONTAINER_PROBES:
-            # Multi-container probes (e.g., containers_state, containers_ports)
-            result = probe_func(containers, probe_name=probe_name)
+        handler = _PROBE_HANDLERS.get(probe_name, _run_generic_probe)
+        result = handler(probe_name, args, container_cache, workspace_root, context)
         
-        elif probe_name in _SINGLE_CONTAINER_PROBES:
-            # Single-container probes - use runtime for resolution
-            args["probe_name"] = probe_name
-            probe_result = invoke_with_container_resolution(probe_func, args, client, containers)
-            result = probe_result.to_dict() if isinstance(probe_result, ProbeResult) else probe_result
-            
-        elif probe_name in ["dns_resolution", "tcp_connection", "http_connection"]:
-            # Network probes - pass args directly
-            result = probe_func(**args, probe_name=probe_name)
-            
-        elif probe_name == "config_files_detection":
-            root_path = args.get("root_path") or workspace_root or "."
-            max_depth = args.get("max_depth", 3)
-            result = probe_func(
-                root_path=root_path,
-                probe_name=probe_name,
-                max_depth=max_depth,
-            )
-            
-        elif probe_name in ["env_files_parsing", "docker_compose_parsing", "generic_config_parsing"]:
-            # Parsing probes - dependencies already resolved
-            found_files = args.get("found_files", [])
-            result = probe_func(found_files, probe_name=probe_name)
-            
-        else:
-            # Generic probe execution
-            result = probe_func(**args, probe_name=probe_name)
+        # Only remember successful results; failures should be retried
+        if memo_key and _is_successful_result(result):
+            context.probe_memo[memo_key] = (time.monotonic(), result)
             
         return result
         
@@ -326,8 +388,138 @@ def execute_probe(
         }
 
 
+def _discover_containers(
+    probe_name: str,
+    container_cache: ContainerCache,
+    context: Optional['DebugContext']
+):
+    """Discover containers for a container-scoped probe.
+    
+    Returns:
+        Tuple of (containers, client, error_dict); error_dict is None on success
+    """
+    containers, client = container_cache.discover(context)
+    if not containers:
+        return None, None, {
+            "error": "No containers available or failed to connect to Docker",
+            "probe_name": probe_name
+        }
+    return containers, client, None
+
+
+def _run_multi_container_probe(
+    probe_name: str,
+    args: dict,
+    container_cache: ContainerCache,
+    workspace_root: Optional[str],
+    context: Optional['DebugContext']
+) -> Any:
+    """Multi-container probes (e.g., containers_state, containers_ports) get every container."""
+    containers, _, error = _discover_containers(probe_name, container_cache, context)
+    if error:
+        return error
+    # Forward only the args the probe declares (e.g. containers_state's include_stopped)
+    extra_args = {k: v for k, v in args.items() if k in PROBES[probe_name].args}
+    return probe_registry[probe_name](containers, probe_name=probe_name, **extra_args)
+
+
+def _run_single_container_probe(
+    probe_name: str,
+    args: dict,
+    container_cache: ContainerCache,
+    workspace_root: Optional[str],
+    context: Optional['DebugContext']
+) -> Any:
+    """Single-container probes - use runtime to resolve the container reference."""
+    containers, client, error = _discover_containers(probe_name, container_cache, context)
+    if error:
+        return error
+    args["probe_name"] = probe_name
+    probe_result = invoke_with_container_resolution(
+        probe_registry[probe_name], args, client, containers, by_name=container_cache.by_name
+    )
+    return probe_result.to_dict() if isinstance(probe_result, ProbeResult) else probe_result
+
+
+def _run_config_detection_probe(
+    probe_name: str,
+    args: dict,
+    container_cache: ContainerCache,
+    workspace_root: Optional[str],
+    context: Optional['DebugContext']
+) -> Any:
+    """Config file detection - defaults the search root to the workspace."""
+    return probe_registry[probe_name](
+        root_path=args.get("root_path") or workspace_root or ".",
+        probe_name=probe_name,
+        max_depth=args.get("max_depth", 3),
+    )
+
+
+def _run_config_parsing_probe(
+    probe_name: str,
+    args: dict,
+    container_cache: ContainerCache,
+    workspace_root: Optional[str],
+    context: Optional['DebugContext']
+) -> Any:
+    """Parsing probes - found_files was already filled in by dependency resolution."""
+    extra_args = {k: v for k, v in args.items() if k != "found_files"}
+    return probe_registry[probe_name](args.get("found_files", []), probe_name=probe_name, **extra_args)
+
+
+def _run_generic_probe(
+    probe_name: str,
+    args: dict,
+    container_cache: ContainerCache,
+    workspace_root: Optional[str],
+    context: Optional['DebugContext']
+) -> Any:
+    """Generic probe execution (network, volume, ...) - pass args directly."""
+    return probe_registry[probe_name](**args, probe_name=probe_name)
+
+
+# Probe name -> handler; anything not listed runs through _run_generic_probe
+_PROBE_HANDLERS: Dict[str, Callable[..., Any]] = {
+    **{name: _run_multi_container_probe for name in _MULTI_CONTAINER_PROBES},
+    **{name: _run_single_container_probe for name in _SINGLE_CONTAINER_PROBES},
+    "config_files_detection": _run_config_detection_probe,
+    **{name: _run_config_parsing_probe for name, spec in PROBES.items() if "found_files" in spec.provides},
+}
+
+
+def _is_successful_result(result: Any) -> bool:
+    """Check whether a probe result (ProbeResult or flattened dict) succeeded."""
+    if isinstance(result, ProbeResult):
+        return result.success
+    if isinstance(result, dict):
+        return bool(result.get("success", True)) and not result.get("error")
+    return True
+
+
+def _append_rolling_digest(digest: str, entry: str) -> str:
+    """Append a finding headline to the rolling digest, keeping only the newest lines.
+    
+    The digest gives evidence_digest context on earlier findings without
+    re-sending every detailed summary (which grows quadratically over a session).
+    """
+    digest = f"{digest}\n{entry}" if digest else entry
+    if len(digest) > _PRIOR_DIGEST_MAX_CHARS:
+        cut = digest.find("\n", len(digest) - _PRIOR_DIGEST_MAX_CHARS)
+        digest = digest[cut + 1:] if cut != -1 else digest[-_PRIOR_DIGEST_MAX_CHARS:]
+    return digest
+
+
 def format_probe_result(result) -> str:
     """Format probe result as readable text for the LLM."""
+    if ORJSON_AVAILABLE:
+        try:
+            return orjson.dumps(
+                result, option=orjson.OPT_INDENT_2 | orjson.OPT_NON_STR_KEYS, default=str
+            ).decode()
+        except TypeError:
+            # e.g. tuple dict keys - let the stdlib encoder have a go
+            pass
     try:
         return json.dumps(result, indent=2, default=str)
     except Exception:
@@ -408,6 +600,18 @@ def _debug_loop_impl(
     """
     max_steps = session.max_steps
     
+    # Probe documentation for the planner only depends on the excluded probes - build it once
+    tools_spec = build_tools_spec(excluded_probes=excluded_probes)
+    
+    # Signatures of executed probes, kept alongside session.probe_history for duplicate checks
+    executed_signatures = session.get_executed_probe_signatures()
+    
+    # Headlines of earlier findings - bounded context for evidence_digest
+    rolling_digest = ""
+    
+    # One "i. probe - args" line per executed probe, appended as probes run
+    probes_summary_lines: List[str] = []
+    
     for step in range(max_steps):
         context.vprint(f"\n{'='*60}")
         context.vprint(f"Step {step + 1}/{max_steps}")
@@ -470,7 +674,6 @@ def _debug_loop_impl(
             if ui_callback:
                 ui_callback.update_activity("Planning diagnostic probe...")
             
-            tools_spec = build_tools_spec(excluded_probes=excluded_probes)
             planning_input = ProbePlanningInput(
                 evidence=evidence,
                 hypotheses=hypotheses_str,  # Use string representation for LLM
@@ -506,21 +709,15 @@ def _debug_loop_impl(
                 ui_callback.update_probe_plan(probe_name, probe_args, expected_signal)
             
             # Check if this exact probe+args combination has been executed before
-            # Create temporary ProbeCall to compute signature
-            temp_probe = ProbeCall(
-                step=step + 1,
-                probe_name=probe_name,
-                probe_args=parse_probe_args(probe_args)
-            )
-            probe_signature = temp_probe.compute_signature()
+            probe_signature = ProbeCall.signature_for(probe_name, dict(parse_probe_args(probe_args)))
             
-            if probe_signature in session.get_executed_probe_signatures():
+            if probe_signature in executed_signatures:
                 context.vprint(f"\n⚠ WARNING: This exact probe has already been executed!")
                 context.vprint(f"   Probe: {probe_name}")
                 context.vprint(f"   Args: {probe_args}")
                 context.vprint(f"   Skipping duplicate and moving to next iteration...\n")
                 # Add a note to evidence that the agent tried to repeat
-                context.evidence_log.append(f"[Step {step + 1}] Agent attempted to repeat {probe_name} with same args - skipped")
+                context.add_evidence(f"[Step {step + 1}] Agent attempted to repeat {probe_name} with same args - skipped")
                 continue
             
             context.vprint(f"\nProbe: {probe_name}")
@@ -565,17 +762,21 @@ def _debug_loop_impl(
             probe_call = ProbeCall(
                 step=step + 1,
                 probe_name=probe_name,
-                probe_args=parse_probe_args(probe_args),
+                probe_args=dict(parse_probe_args(probe_args)),
                 started_at=probe_start,
                 finished_at=probe_end,
                 result=normalized_result,
                 error=str(normalized_result.get("error")) if isinstance(normalized_result, dict) and normalized_result.get("error") else None,
             )
-            probe_call.signature = probe_call.compute_signature()
+            probe_call.signature = probe_signature
             
             # Add to session
             session.probe_history.append(probe_call)
+            executed_signatures.add(probe_signature)
             session.current_step = step + 1
+            probes_summary_lines.append(
+                f"{len(session.probe_history)}. {probe_call.probe_name} - {probe_call.probe_args}"
+            )
             
             # Trace probe execution
             trace_probe_execution(
@@ -591,15 +792,17 @@ def _debug_loop_impl(
                 ui_callback.add_probe_execution(step + 1, probe_name, success)
             
             probe_result_str = format_probe_result(raw_probe_result)
-            context.vprint(f"\nProbe result:\n{probe_result_str[:500]}...")
-            if probe_call.duration_seconds:
-                context.vprint(f"Execution time: {probe_call.duration_seconds:.2f}s")
+            # Skip building the console-only strings when nothing will be printed
+            if context.verbose:
+                context.vprint("\nProbe result:\n" + probe_result_str[:500] + "...")
+                if probe_call.duration_seconds:
+                    context.vprint(f"Execution time: {probe_call.duration_seconds:.2f}s")
             
             # Digest evidence - create a compact summary of this probe's findings
             context.vprint("\nDigesting evidence...")
             if ui_callback:
                 ui_callback.update_activity("Digesting evidence...")
-            prior_evidence_text = "\n".join(context.evidence_log)
+            prior_evidence_text = rolling_digest
             digest_input = EvidenceDigestInput(
                 raw_probe_result=probe_result_str,
                 prior_evidence_digest=prior_evidence_text
@@ -631,44 +834,38 @@ def _debug_loop_impl(
             # Use detailed_summary if available (more context for reasoning), fall back to summary
             finding_text = structured_finding.detailed_summary or structured_finding.summary
             finding_entry = f"[Step {step + 1} - {probe_name}] {finding_text}"
-            context.evidence_log.append(finding_entry)
+            context.add_evidence(finding_entry)
+            rolling_digest = _append_rolling_digest(
+                rolling_digest, f"[Step {step + 1} - {probe_name}] {structured_finding.summary}"
+            )
             
-            context.vprint(f"\nNew finding:\n{structured_finding.summary}")
-            if structured_finding.structured:
-                context.vprint(f"Structured data: {structured_finding.structured}")
+            if context.verbose:
+                context.vprint(f"\nNew finding:\n{structured_finding.summary}")
+                if structured_finding.structured:
+                    context.vprint(f"Structured data: {structured_finding.structured}")
             
             # Update UI with latest finding
             if ui_callback:
-                ui_callback.update_finding({
-                    "summary": structured_finding.summary,
-                    "significance": expected_signal if expected_signal else "N/A",
-                    "severity": structured_finding.severity.value
-                })
+                ui_callback.update_finding(structured_finding)
             
-            # Reconstruct full evidence from initial problem + all findings
-            all_findings = "\n\n".join(context.evidence_log)
+            # Full evidence is the initial problem + all findings (joined incrementally by add_evidence)
+            all_findings = context.evidence_text
             
-            # Build list of previously executed probes for LLM visibility
-            executed_list = []
-            for i, exec_probe in enumerate(session.probe_history, 1):
-                executed_list.append(f"{i}. {exec_probe.probe_name} - {exec_probe.probe_args}")
-            
-            probes_summary = "\n".join(executed_list) if executed_list else "None yet"
+            # List of previously executed probes for LLM visibility
+            probes_summary = "\n".join(probes_summary_lines) if probes_summary_lines else "None yet"
             
             # Calculate remaining steps for agent awareness
             steps_used = step + 1
             steps_remaining = max_steps - steps_used
             
-            evidence = (
-                f"{session.initial_problem}\n\n"
-                f"--- Debug Session Info ---\n"
-                f"Steps used: {steps_used}/{max_steps}\n"
-                f"Steps remaining: {steps_remaining}\n"
-                f"Note: {'Focus on concluding and proposing fixes.' if steps_remaining <= 2 else 'Continue investigating systematically.'}\n\n"
-                f"--- Previously Executed Probes ---\n"
-                f"{probes_summary}\n\n"
-                f"--- Evidence Gathered ---\n\n"
-                f"{all_findings}"
+            evidence = _EVIDENCE_TEMPLATE.format(
+                initial_problem=session.initial_problem,
+                steps_used=steps_used,
+                max_steps=max_steps,
+                steps_remaining=steps_remaining,
+                note=_NOTE_CONCLUDE if steps_remaining <= 2 else _NOTE_CONTINUE,
+                probes_summary=probes_summary,
+                all_findings=all_findings,
             )
             
             # Agent-driven stopping decision
@@ -745,10 +942,7 @@ def _debug_loop_impl(
     
     # Generate final diagnosis and recommendations
     context.vprint("\n\nGenerating final diagnosis...")
-    probes_summary = "\n".join([
-        f"{i}. {p.probe_name} - {p.probe_args}" 
-        for i, p in enumerate(session.probe_history, 1)
-    ])
+    probes_summary = "\n".join(probes_summary_lines)
     
     diagnosis_result = final_diagnosis(
         initial_problem=session.initial_problem,
@@ -28,6 +28,9 @@ from .network_probes import (
     dns_resolution_probe,
     tcp_connection_probe,
     http_connection_probe,
+    network_triage_probe,
+    tcp_connection_batch_probe,
+    http_connection_batch_probe,
 )
 from .config_probes import (
     detect_config_files_probe,
@@ -71,6 +74,9 @@ __all__ = [
     "dns_resolution_probe",
     "tcp_connection_probe",
     "http_connection_probe",
+    "network_triage_probe",
+    "tcp_connection_batch_probe",
+    "http_connection_batch_probe",
     # Config probes
     "detect_config_files_probe",
     "env_files_parsing_probe",
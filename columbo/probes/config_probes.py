@@ -1,12 +1,142 @@
 """Configuration file detection and parsing probes for containerized applications."""
 
+import fnmatch
+import json
+import os
+import re
 from pathlib import Path
+from typing import Any, Optional
 import yaml
 
+# libyaml's C loader is much faster than the pure-Python SafeLoader; same semantics
+try:
+    from yaml import CSafeLoader as _YamlLoader
+except ImportError:
+    from yaml import SafeLoader as _YamlLoader
+
+# orjson is optional: a faster JSON parser for large config files
+try:
+    import orjson
+    ORJSON_AVAILABLE = True
+except ImportError:
+    ORJSON_AVAILABLE = False
+
 from columbo.schemas import ProbeResult
 from .spec import probe
 
 
+# Common config file patterns for containers and environment configuration
+_CONFIG_PATTERNS = {
+    ".env": "environment_variables",
+    ".env.*": "environment_variables",
+    "environment.yaml": "environment_variables",
+    "environment.yml": "environment_variables",
+    "docker-compose.yaml": "docker_compose",
+    "docker-compose.yml": "docker_compose",
+    "docker-compose.*.yaml": "docker_compose",
+    "docker-compose.*.yml": "docker_compose",
+    "config.yaml": "generic_config",
+    "config.yml": "generic_config",
+    "config.json": "generic_config",
+}
+
+# Exact names are a dict hit; only names that miss are tried against the wildcards,
+# compiled into one alternation whose matching group (w0, w1, ...) names the pattern
+_EXACT_CONFIG_NAMES = {p: t for p, t in _CONFIG_PATTERNS.items() if "*" not in p}
+_WILDCARD_CONFIG_TYPES = [t for p, t in _CONFIG_PATTERNS.items() if "*" in p]
+_WILDCARD_CONFIG_RE = re.compile("|".join(
+    "(?P<w%d>%s)" % (i, fnmatch.translate(p).removesuffix(r"\Z"))
+    for i, p in enumerate(p for p in _CONFIG_PATTERNS if "*" in p)
+))
+
+# One KEY=value line of a .env file: leading whitespace, a key that isn't a comment
+# (may be empty, as in "=value"), then everything after the first "="
+_ENV_LINE_RE = re.compile(r"^[^\S\n]*([^\s#=][^=\n]*)?=(.*)$", re.MULTILINE)
+
+# File suffixes parsed as YAML by the parsing probes
+_YAML_SUFFIXES = (".yaml", ".yml")
+
+# Directories that never hold project config but can be huge - not descended into
+_PRUNED_DIRS = frozenset({".git", "node_modules", "__pycache__", ".venv"})
+
+
+def _select_files(*file_types: str):
+    """Build a dependency transform keeping found_files of the given config types.
+    
+    The detection result is filtered on demand rather than also returning a
+    per-type index: the result is fed to the LLM verbatim, and an index would
+    list every file twice.
+    """
+    wanted = frozenset(file_types)
+    return lambda result: {
+        "found_files": [f for f in result.get("found_files", []) if f.get("type") in wanted]
+    }
+
+
+# Compose service keys kept in the default (compact) docker_compose_parsing output;
+# these cover naming, wiring, env, mounts and users - the usual root causes
+_COMPOSE_SERVICE_KEYS = (
+    "image", "build", "container_name", "command", "entrypoint", "user", "working_dir",
+    "environment", "env_file", "ports", "expose", "volumes", "networks", "depends_on",
+)
+
+# Longer string values in compact compose output are cut to this many characters
+_COMPOSE_VALUE_MAX_CHARS = 300
+
+
+def _truncate_value(value: Any) -> Any:
+    """Cut long strings (directly or inside a list/dict) to _COMPOSE_VALUE_MAX_CHARS."""
+    if isinstance(value, str):
+        if len(value) > _COMPOSE_VALUE_MAX_CHARS:
+            return value[:_COMPOSE_VALUE_MAX_CHARS] + "...[truncated]"
+        return value
+    if isinstance(value, list):
+        return [_truncate_value(v) for v in value]
+    if isinstance(value, dict):
+        return {k: _truncate_value(v) for k, v in value.items()}
+    return value
+
+
+def _summarize_service(service: Any) -> Any:
+    """Compact view of one compose service for the LLM's evidence.
+    
+    Keeps the keys in _COMPOSE_SERVICE_KEYS (long strings truncated), reduces
+    a healthcheck to a flag and lists any other keys by name only.
+    """
+    if not isinstance(service, dict):
+        return service
+    summary = {k: _truncate_value(service[k]) for k in _COMPOSE_SERVICE_KEYS if k in service}
+    if "healthcheck" in service:
+        summary["has_healthcheck"] = True
+    omitted = sorted(
+        str(k) for k in service if k not in summary and k != "healthcheck"
+    )
+    if omitted:
+        summary["omitted_keys"] = omitted
+    return summary
+
+
+def _load_json(text: str | bytes) -> Any:
+    """Parse JSON text or bytes, using orjson when available."""
+    if ORJSON_AVAILABLE:
+        try:
+            return orjson.loads(text)
+        except orjson.JSONDecodeError:
+            # orjson is stricter (e.g. NaN, big ints) - let stdlib have the final say
+            pass
+    return json.loads(text)
+
+
+def _config_file_type(name: str) -> Optional[str]:
+    """Return the config type for a file name, or None if it isn't a config file."""
+    file_type = _EXACT_CONFIG_NAMES.get(name)
+    if file_type is None:
+        match = _WILDCARD_CONFIG_RE.fullmatch(name)
+        if match:
+            return _WILDCARD_CONFIG_TYPES[int(match.lastgroup[1:])]
+    return file_type
+
+
 @probe(
     name="config_files_detection",
     description="Scan workspace for configuration files (docker-compose, .env, etc.)",
@@ -34,21 +164,6 @@ def detect_config_files_probe(
     Returns:
         dict: Contains list of found config files with their paths and types
     """
-    # Common config file patterns for containers and environment configuration
-    config_patterns = {
-        ".env": "environment_variables",
-        ".env.*": "environment_variables",
-        "environment.yaml": "environment_variables",
-        "environment.yml": "environment_variables",
-        "docker-compose.yaml": "docker_compose",
-        "docker-compose.yml": "docker_compose",
-        "docker-compose.*.yaml": "docker_compose",
-        "docker-compose.*.yml": "docker_compose",
-        "config.yaml": "generic_config",
-        "config.yml": "generic_config",
-        "config.json": "generic_config",
-    }
-    
     try:
         root = Path(root_path)
         if not root.exists():
@@ -66,45 +181,46 @@ def detect_config_files_probe(
         found_files = []
         scanned_dirs = 0
         
-        # Scan directory recursively up to max_depth
-        for item in root.rglob("*"):
+        # Depth-first scan (same order as a recursive glob) that only lists directories
+        # whose entries are within max_depth, instead of walking the whole tree
+        stack = [("", 0)]
+        while stack:
+            rel_dir, depth = stack.pop()
             try:
-                # Calculate depth relative to root
-                depth = len(item.relative_to(root).parts) - 1
-                if depth > max_depth:
-                    continue
-                
-                if item.is_dir():
-                    scanned_dirs += 1
-                    continue
-                
-                # Check if file matches any config pattern
-                for pattern, file_type in config_patterns.items():
-                    if "*" in pattern:
-                        # Handle wildcard patterns
-                        if item.match(pattern):
-                            found_files.append({
-                                "path": str(item.relative_to(root)),
-                                "absolute_path": str(item),
-                                "type": file_type,
-                                "size_bytes": item.stat().st_size,
-                                "exists": True,
-                            })
-                            break
-                    else:
-                        # Exact filename match
-                        if item.name == pattern:
-                            found_files.append({
-                                "path": str(item.relative_to(root)),
-                                "absolute_path": str(item),
-                                "type": file_type,
-                                "size_bytes": item.stat().st_size,
-                                "exists": True,
-                            })
-                            break
-            except (PermissionError, OSError):
-                # Skip files/dirs we can't access
+                with os.scandir(root / rel_dir) as it:
+                    entries = list(it)
+            except OSError:
+                # Skip dirs we can't access
                 continue
+            
+            subdirs = []
+            for entry in entries:
+                try:
+                    rel_path = os.path.join(rel_dir, entry.name) if rel_dir else entry.name
+                    
+                    if entry.is_dir():
+                        scanned_dirs += 1
+                        # Symlinked dirs are counted but not followed
+                        if (depth < max_depth and entry.name not in _PRUNED_DIRS
+                                and entry.is_dir(follow_symlinks=False)):
+                            subdirs.append(rel_path)
+                        continue
+                    
+                    # Check if file matches any config pattern
+                    file_type = _config_file_type(entry.name)
+                    if file_type:
+                        found_files.append({
+                            "path": rel_path,
+                            "absolute_path": str(root / rel_path),
+                            "type": file_type,
+                            "size_bytes": entry.stat().st_size,
+                            "exists": True,
+                        })
+                except OSError:
+                    # Skip files/dirs we can't access
+                    continue
+            
+            stack.extend((d, depth + 1) for d in reversed(subdirs))
         
         return ProbeResult(
             probe_name=probe_name,
@@ -143,10 +259,8 @@ def detect_config_files_probe(
     required_args=set(),
     example="{}",
     requires="config_files_detection",
-    transform=lambda result: {
-        "found_files": [f for f in result.get("found_files", [])
-                       if f.get("type") == "environment_variables"]
-    }
+    provides={"found_files"},
+    transform=_select_files("environment_variables"),
 )
 def env_files_parsing_probe(found_files, probe_name: str = "env_files_parsing") -> ProbeResult:
     """Parse environment variable files (.env, environment.yml/yaml) to extract variables.
@@ -162,7 +276,10 @@ def env_files_parsing_probe(found_files, probe_name: str = "env_files_parsing")
     
     for file_info in found_files:
         path = file_info.get("absolute_path")
-        if not path or not Path(path).is_file():
+        if not path:
+            continue
+        # Entries from config_files_detection were just confirmed to be files
+        if not file_info.get("exists") and not os.path.isfile(path):
             continue
         
         env_vars = {}
@@ -171,25 +288,19 @@ def env_files_parsing_probe(found_files, probe_name: str = "env_files_parsing")
             file_path = Path(path)
             
             # Determine file format and parse accordingly
-            if file_path.suffix in [".yml", ".yaml"]:
+            if file_path.suffix in _YAML_SUFFIXES:
                 # Parse as YAML
                 file_format = "yaml"
-                with open(path, "r") as f:
-                    content = yaml.safe_load(f)
-                    if isinstance(content, dict):
-                        # Flatten nested dict to simple key-value pairs
-                        env_vars = {str(k): str(v) for k, v in content.items()}
+                content = yaml.load(file_path.read_bytes(), Loader=_YamlLoader)
+                if isinstance(content, dict):
+                    # Flatten nested dict to simple key-value pairs
+                    env_vars = {str(k): str(v) for k, v in content.items()}
             else:
                 # Parse as .env format (KEY=value lines)
                 file_format = "dotenv"
-                with open(path, "r") as f:
-                    for line in f:
-                        line = line.strip()
-                        if not line or line.startswith("#"):
-                            continue
-                        if "=" in line:
-                            key, value = line.split("=", 1)
-                            env_vars[key.strip()] = value.strip().strip('"').strip("'")
+                for match in _ENV_LINE_RE.finditer(file_path.read_text()):
+                    key, value = match.groups()
+                    env_vars[(key or "").strip()] = value.strip().strip('"').strip("'")
             
             parsed_envs.append({
                 "file_path": path,
@@ -225,37 +336,44 @@ def env_files_parsing_probe(found_files, probe_name: str = "env_files_parsing")
     scope="config",
     tags={"parsing", "docker-compose"},
     args={
-        "found_files": "Optional: list from config_files_detection. Will auto-discover if not provided."
+        "found_files": "Optional: list from config_files_detection. Will auto-discover if not provided.",
+        "full": "Return complete service definitions instead of the compact summary (default: false)"
     },
     required_args=set(),
     example="{}",
     requires="config_files_detection",
-    transform=lambda result: {
-        "found_files": [f for f in result.get("found_files", [])
-                       if f.get("type") == "docker_compose"]
-    }
+    provides={"found_files"},
+    transform=_select_files("docker_compose"),
 )
-def docker_compose_parsing_probe(found_files, probe_name: str = "docker_compose_parsing") -> ProbeResult:
+def docker_compose_parsing_probe(
+    found_files, full: bool = False, probe_name: str = "docker_compose_parsing"
+) -> ProbeResult:
     """Parse docker-compose files to extract service definitions.
     
     Args:
         found_files: List of dicts with 'absolute_path' keys pointing to docker-compose files
+        full: Return services verbatim instead of the compact summary
         probe_name: Name of the probe for identification
     Returns:
         dict: Contains parsed service definitions from each docker-compose file
     """
+    full = str(full).lower() in ("true", "1", "yes")
     parsed_compose_files = []
     
     for file_info in found_files:
         path = file_info.get("absolute_path")
-        if not path or not Path(path).is_file():
+        if not path:
+            continue
+        # Entries from config_files_detection were just confirmed to be files
+        if not file_info.get("exists") and not os.path.isfile(path):
             continue
         
         services = {}
         try:
-            with open(path, "r") as f:
-                content = yaml.safe_load(f)
-                services = content.get("services", {})
+            content = yaml.load(Path(path).read_bytes(), Loader=_YamlLoader)
+            services = content.get("services", {})
+            if not full and isinstance(services, dict):
+                services = {name: _summarize_service(svc) for name, svc in services.items()}
             
             parsed_compose_files.append({
                 "file_path": path,
@@ -294,10 +412,8 @@ def docker_compose_parsing_probe(found_files, probe_name: str = "docker_compose_
     required_args=set(),
     example="{}",
     requires="config_files_detection",
-    transform=lambda result: {
-        "found_files": [f for f in result.get("found_files", [])
-                       if f.get("type") in ("generic_config", "environment_variables")]
-    }
+    provides={"found_files"},
+    transform=_select_files("generic_config", "environment_variables"),
 )
 def generic_config_parsing_probe(found_files, probe_name: str = "generic_config_parsing") -> ProbeResult:
     """Parse generic configuration files (YAML/JSON) to extract settings.
@@ -313,7 +429,10 @@ def generic_config_parsing_probe(found_files, probe_name: str = "generic_config_
     
     for file_info in found_files:
         path = file_info.get("absolute_path")
-        if not path or not Path(path).is_file():
+        if not path:
+            continue
+        # Entries from config_files_detection were just confirmed to be files
+        if not file_info.get("exists") and not os.path.isfile(path):
             continue
         
         config_data = None
@@ -321,13 +440,13 @@ def generic_config_parsing_probe(found_files, probe_name: str = "generic_config_
         error = None
         
         try:
-            with open(path, "r") as f:
-                if path.endswith((".yaml", ".yml")):
-                    config_data = yaml.safe_load(f)
-                elif path.endswith(".json"):
-                    import json
-                    config_data = json.load(f)
-                parsed = True
+            # One read; both parsers take bytes and detect the encoding themselves
+            raw = Path(path).read_bytes()
+            if path.endswith(_YAML_SUFFIXES):
+                config_data = yaml.load(raw, Loader=_YamlLoader)
+            elif path.endswith(".json"):
+                config_data = _load_json(raw)
+            parsed = True
         
         except Exception as e:
             error = str(e)
@@ -1,39 +1,58 @@
 """Container-related probes for inspecting Docker container states, logs, and execution."""
 
-from typing import List, Union
-from docker.models.containers import Container
+from __future__ import annotations
+
+from typing import TYPE_CHECKING, List, Union
 from columbo.schemas import ProbeResult
 from .spec import probe
 
+# Container is only used in type hints; callers pass in objects from an existing docker client
+if TYPE_CHECKING:
+    from docker.models.containers import Container
+
+# Container states reported as healthy by containers_state
+_HEALTHY_STATUSES = frozenset({"running"})
+
+# container_logs keeps at most this many bytes per requested line (newest kept)
+_LOG_BYTES_PER_LINE = 512
+
 
 @probe(
     name="containers_state",
     description="Check status of all Docker containers (running, stopped, etc.)",
     scope="container",
     tags={"state", "health"},
-    args={},
+    args={
+        "include_stopped": "Include stopped/exited containers (default: true). Set false to list only running ones."
+    },
     required_args=set(),
     example="{}"
 )
-def containers_state_probe(containers: List[Container], probe_name: str = "containers_state") -> ProbeResult:
+def containers_state_probe(
+    containers: List[Container], include_stopped=True, probe_name: str = "containers_state"
+) -> ProbeResult:
     """Check the status of multiple containers.
     
     Args:
         containers: List of Docker container objects to inspect
+        include_stopped: Include containers that are not running (default: True)
         probe_name: Identifier for this probe execution
         
     Returns:
         list: Status information for each container including health status
     """
+    include_stopped = str(include_stopped).lower() not in ("false", "0", "no")
     evidence = []
     for container in containers:
         try:
             status = container.status
+            if not include_stopped and status != "running":
+                continue
             evidence.append(
                 {
                     "container": container.name,
                     "status": status,
-                    "healthy": status == "running",
+                    "healthy": status in _HEALTHY_STATUSES,
                 }
             )
         except Exception as e:
@@ -76,22 +95,47 @@ def container_logs_probe(container: Container, tail=50, probe_name: str = "conta
         dict: Log excerpt with metadata
     """
     try:
-        logs = container.logs(tail=tail)
+        logs = container.logs(tail=tail, stream=True, follow=False)
+        truncated = False
+
+        if not isinstance(logs, (bytes, bytearray, str)):
+            # Stream the chunks, keeping only the newest bytes so a huge tail
+            # never sits in memory (or in the evidence) in full
+            max_bytes = _LOG_BYTES_PER_LINE * int(tail) if str(tail).isdigit() else None
+            buffer = bytearray()
+            cut_mid_line = False
+            for chunk in logs:
+                buffer += chunk
+                if max_bytes is not None and len(buffer) > max_bytes:
+                    cut = len(buffer) - max_bytes
+                    cut_mid_line = buffer[cut - 1] != ord("\n")
+                    del buffer[:cut]
+                    truncated = True
+            if cut_mid_line:
+                # Start on a line boundary rather than mid-line (or mid-character),
+                # unless that would drop everything: then keep the partial line
+                newline = buffer.find(b"\n")
+                if newline != -1 and buffer[newline + 1:].strip():
+                    del buffer[:newline + 1]
+            logs = bytes(buffer)
 
-        if isinstance(logs, bytes):
+        if isinstance(logs, (bytes, bytearray)):
             logs = logs.decode("utf-8", errors="replace")
         elif not isinstance(logs, str):
             logs = str(logs)
 
+        data = {
+            "container": container.name,
+            "tail": tail,
+            "log_excerpt": logs,
+            "empty": not logs or logs.isspace(),
+        }
+        if truncated:
+            data["truncated"] = True
         return ProbeResult(
             probe_name=probe_name,
             success=True,
-            data={
-                "container": container.name,
-                "tail": tail,
-                "log_excerpt": logs,
-                "empty": len(logs.strip()) == 0,
-            }
+            data=data
         )
 
     except Exception as e:
@@ -138,22 +182,25 @@ def container_exec_probe(
         dict: Execution results including exit code, stdout, and stderr
     """
     try:
-        # Execute with shell to support pipes, redirects, and other shell operators
-        # Escape single quotes in the command by replacing ' with '\''
-        escaped_command = command.replace("'", "'\\''")
-        exec_log = container.exec_run(
-            f"sh -c '{escaped_command}'",
-            demux=True
-        )  # (stdout, stderr)
-        stdout_b, stderr_b = exec_log.output if exec_log.output else (b"", b"")
+        # Execute with shell to support pipes, redirects, and other shell operators;
+        # the command goes to sh as its own argv entry, so no quoting is needed
+        api = container.client.api
+        exec_id = api.exec_create(container.id, ["sh", "-c", command])["Id"]
 
-        def _dec(b):
-            if not b:
-                return ""
-            return b.decode("utf-8", errors="replace") if isinstance(b, (bytes, bytearray)) else str(b)
+        # A UTF-8 char is at most 4 bytes, so this many bytes always decode to more
+        # than tail_chars chars. The output is streamed and drained to the end (so the
+        # exit code is final), but nothing past the cap is kept in memory
+        max_bytes = (tail_chars + 1) * 4
+        stdout_b, stderr_b = bytearray(), bytearray()
+        for out, err in api.exec_start(exec_id, stream=True, demux=True):
+            if out and len(stdout_b) < max_bytes:
+                stdout_b += out[:max_bytes - len(stdout_b)]
+            if err and len(stderr_b) < max_bytes:
+                stderr_b += err[:max_bytes - len(stderr_b)]
+        exit_code = api.exec_inspect(exec_id)["ExitCode"]
 
-        stdout = _dec(stdout_b)
-        stderr = _dec(stderr_b)
+        stdout = stdout_b.decode("utf-8", errors="replace")
+        stderr = stderr_b.decode("utf-8", errors="replace")
 
         # truncate to keep evidence small
         if len(stdout) > tail_chars:
@@ -167,8 +214,8 @@ def container_exec_probe(
             data={
                 "container": container.name,
                 "command": command,
-                "exit_code": exec_log.exit_code,
-                "success": exec_log.exit_code == 0,
+                "exit_code": exit_code,
+                "success": exit_code == 0,
                 "stdout_excerpt": stdout,
                 "stderr_excerpt": stderr,
             }
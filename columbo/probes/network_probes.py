@@ -1,13 +1,51 @@
 """Network-related probes for testing connectivity, DNS resolution, and HTTP endpoints."""
 
+import atexit
 import socket
 import time
+from concurrent.futures import ThreadPoolExecutor
+
 import requests
+from requests.adapters import HTTPAdapter
 
 from columbo.schemas import ProbeResult
 from .spec import probe
 
 
+# Shared session so repeated probes against the same host reuse keep-alive connections
+_HTTP = requests.Session()
+_HTTP.mount("http://", HTTPAdapter(pool_connections=16, pool_maxsize=32))
+_HTTP.mount("https://", HTTPAdapter(pool_connections=16, pool_maxsize=32))
+atexit.register(_HTTP.close)
+
+# Characters of the response body kept in http_connection results
+_BODY_EXCERPT_CHARS = 300
+
+# Floor for the connect-phase bound of HTTP probes; `timeout` still bounds the read.
+# Dead or black-holed ports fail fast, while the TLS handshake (part of the connect
+# phase) still gets a share of the budget that scales with `timeout`
+_HTTP_MIN_CONNECT_TIMEOUT = 1.0
+
+
+def _http_connect_timeout(timeout: float) -> float:
+    """Connect-phase timeout for an HTTP probe with the given overall timeout."""
+    return min(timeout, max(_HTTP_MIN_CONNECT_TIMEOUT, timeout / 3))
+
+
+def _body_excerpt(response: requests.Response) -> str:
+    """Decode just the start of a response body, as response.text would."""
+    # No encoding may use more than 4 bytes per char, so this prefix is enough
+    head = response.content[:(_BODY_EXCERPT_CHARS + 1) * 4]
+    if not head:
+        return ""
+    encoding = response.encoding or response.apparent_encoding or "utf-8"
+    try:
+        text = head.decode(encoding, errors="replace")
+    except LookupError:
+        text = head.decode("utf-8", errors="replace")
+    return text[:_BODY_EXCERPT_CHARS]
+
+
 @probe(
     name="dns_resolution",
     description="Resolve a hostname to IP addresses",
@@ -30,7 +68,8 @@ def dns_resolution_probe(hostname: str, probe_name: str = "dns_resolution") -> P
         dict: Contains resolved IPs and success status
     """
     try:
-        infos = socket.getaddrinfo(hostname, None)
+        # One socket type is enough to list the addresses; avoids a tuple per type/protocol
+        infos = socket.getaddrinfo(hostname, None, type=socket.SOCK_STREAM)
         ips = sorted({info[4][0] for info in infos})
         return ProbeResult(
             probe_name=probe_name,
@@ -124,9 +163,10 @@ def http_connection_probe(
     """
     start = time.time()
     try:
-        r = requests.get(url, timeout=timeout)
+        connect_timeout = _http_connect_timeout(float(timeout))
+        r = _HTTP.get(url, timeout=(connect_timeout, float(timeout)))
         elapsed_ms = int((time.time() - start) * 1000)
-        text = (r.text or "")[:300]
+        text = _body_excerpt(r)
         ok = 200 <= r.status_code < 300
         return ProbeResult(
             probe_name=probe_name,
@@ -152,3 +192,169 @@ def http_connection_probe(
                 "latency_ms": elapsed_ms,
             }
         )
+
+
+@probe(
+    name="network_triage",
+    description="Check DNS, TCP ports and HTTP paths for one host in a single step (checks run concurrently)",
+    scope="network",
+    tags={"dns", "tcp", "http", "connectivity"},
+    args={
+        "host": "Target host (required)",
+        "ports": "List of ports to test over TCP (optional)",
+        "paths": "List of HTTP paths to request on each port, e.g. [\"/health\"] (optional)",
+        "timeout": "Per-check timeout in seconds (default: 5.0)"
+    },
+    required_args={"host"},
+    example='{"host": "localhost", "ports": [8000, 6333], "paths": ["/health"]}'
+)
+def network_triage_probe(
+    host: str,
+    ports=None,
+    paths=None,
+    timeout: float = 5.0,
+    probe_name: str = "network_triage",
+) -> ProbeResult:
+    """Run DNS, TCP and HTTP checks for a host concurrently.
+    
+    Args:
+        host: Target host (required)
+        ports: Port or list of ports to test over TCP
+        paths: HTTP path or list of paths to request on every port
+        timeout: Per-check timeout in seconds (default: 5.0)
+        probe_name: Identifier for this probe execution
+        
+    Returns:
+        ProbeResult with the individual dns/tcp/http results
+    """
+    try:
+        ports = [int(p) for p in ([ports] if isinstance(ports, (int, str)) else ports or [])]
+        paths = [str(p) for p in ([paths] if isinstance(paths, str) else paths or [])]
+    except (TypeError, ValueError) as e:
+        return ProbeResult(
+            probe_name=probe_name,
+            success=False,
+            error=f"Invalid ports/paths: {type(e).__name__}: {str(e)}",
+            data={"host": host}
+        )
+    
+    urls = [
+        f"http://{host}:{port}{path if path.startswith('/') else '/' + path}"
+        for port in ports
+        for path in paths
+    ]
+    
+    # Every check is I/O-bound and independent, so run them all at once
+    with ThreadPoolExecutor(max_workers=min(16, 1 + len(ports) + len(urls))) as pool:
+        dns_future = pool.submit(dns_resolution_probe, host)
+        tcp_futures = [pool.submit(tcp_connection_probe, host, port, timeout) for port in ports]
+        http_futures = [pool.submit(http_connection_probe, url, timeout) for url in urls]
+        
+        return ProbeResult(
+            probe_name=probe_name,
+            success=True,
+            data={
+                "host": host,
+                "dns": dns_future.result().to_dict(),
+                "tcp": [f.result().to_dict() for f in tcp_futures],
+                "http": [f.result().to_dict() for f in http_futures],
+            }
+        )
+
+
+def _parse_tcp_target(target) -> tuple:
+    """Normalize a TCP target given as "host:port", [host, port] or {"host", "port"}."""
+    if isinstance(target, dict):
+        return str(target["host"]), int(target["port"])
+    if isinstance(target, str):
+        host, _, port = target.rpartition(":")
+        return host.strip("[]"), int(port)
+    host, port = target
+    return str(host), int(port)
+
+
+@probe(
+    name="tcp_connection_batch",
+    description="Test TCP connections to several host:port targets at once (checks run concurrently)",
+    scope="network",
+    tags={"tcp", "connectivity"},
+    args={
+        "targets": "List of targets as \"host:port\" strings (required)",
+        "timeout": "Per-connection timeout in seconds (default: 5.0)"
+    },
+    required_args={"targets"},
+    example='{"targets": ["qdrant:6333", "postgres:5432"]}'
+)
+def tcp_connection_batch_probe(
+    targets, timeout: float = 5.0, probe_name: str = "tcp_connection_batch"
+) -> ProbeResult:
+    """Test TCP connections to several targets concurrently.
+    
+    Args:
+        targets: List of "host:port" strings, [host, port] pairs or {"host", "port"} dicts
+        timeout: Per-connection timeout in seconds (default: 5.0)
+        probe_name: Identifier for this probe execution
+        
+    Returns:
+        ProbeResult with one tcp_connection result per target, in input order
+    """
+    try:
+        parsed = [_parse_tcp_target(t) for t in ([targets] if isinstance(targets, str) else targets)]
+    except (KeyError, TypeError, ValueError) as e:
+        return ProbeResult(
+            probe_name=probe_name,
+            success=False,
+            error=f"Invalid targets: {type(e).__name__}: {str(e)}",
+            data={"targets": targets}
+        )
+    
+    if not parsed:
+        return ProbeResult(probe_name=probe_name, success=True, data={"results": [], "ok": True})
+    
+    with ThreadPoolExecutor(max_workers=min(16, len(parsed))) as pool:
+        results = list(pool.map(lambda t: tcp_connection_probe(t[0], t[1], timeout).to_dict(), parsed))
+    
+    return ProbeResult(
+        probe_name=probe_name,
+        success=True,
+        data={"results": results, "ok": all(r["ok"] for r in results)}
+    )
+
+
+@probe(
+    name="http_connection_batch",
+    description="Test HTTP connections to several URLs at once (requests run concurrently)",
+    scope="network",
+    tags={"http", "connectivity"},
+    args={
+        "urls": "List of full URLs to test (required)",
+        "timeout": "Per-request timeout in seconds (default: 5.0)"
+    },
+    required_args={"urls"},
+    example='{"urls": ["http://localhost:8000/health", "http://localhost:6333/readyz"]}'
+)
+def http_connection_batch_probe(
+    urls, timeout: float = 5.0, probe_name: str = "http_connection_batch"
+) -> ProbeResult:
+    """Test HTTP connections to several URLs concurrently.
+    
+    Args:
+        urls: List of full URLs to test (required)
+        timeout: Per-request timeout in seconds (default: 5.0)
+        probe_name: Identifier for this probe execution
+        
+    Returns:
+        ProbeResult with one http_connection result per URL, in input order
+    """
+    urls = [str(u) for u in ([urls] if isinstance(urls, str) else urls or [])]
+    if not urls:
+        return ProbeResult(probe_name=probe_name, success=True, data={"results": [], "ok": True})
+    
+    with ThreadPoolExecutor(max_workers=min(16, len(urls))) as pool:
+        results = list(pool.map(lambda u: http_connection_probe(u, timeout).to_dict(), urls))
+    
+    return ProbeResult(
+        probe_name=probe_name,
+        success=True,
+        data={"results": results, "ok": all(r["ok"] for r in results)}
+    )
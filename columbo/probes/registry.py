@@ -43,6 +43,7 @@ PROBE_DEPENDENCIES = {
     name: {
         "requires": spec.requires,
         "transform": spec.transform,
+        "provides": spec.provides,
         "description": f"Requires {spec.requires} to be executed first",
     }
     for name, spec in PROBES.items()
@@ -5,18 +5,23 @@ and invoking probes with proper type conversions. This keeps individual
 probes clean and focused on their diagnostic logic.
 """
 
-from typing import Any, Callable, Dict, List, Optional
-from docker import DockerClient
-from docker.models.containers import Container
-from docker.errors import NotFound, APIError
+from __future__ import annotations
+
+from typing import TYPE_CHECKING, Any, Callable, Dict, List, Optional
 
 from columbo.schemas import ProbeResult
 
+# docker is only needed for type hints here; importing it is deferred until a probe talks to Docker
+if TYPE_CHECKING:
+    from docker import DockerClient
+    from docker.models.containers import Container
+
 
 def resolve_container(
     client: DockerClient,
     containers: List[Container],
-    container_ref: str
+    container_ref: str,
+    by_name: Optional[Dict[str, Container]] = None
 ) -> Optional[Container]:
     """Resolve a container name or ID to a Container object.
     
@@ -27,17 +32,26 @@ def resolve_container(
         client: Docker client instance
         containers: List of available containers (from cache)
         container_ref: Container name or ID to resolve
+        by_name: Optional name -> Container index of the same containers
         
     Returns:
         Container object if found, None otherwise
     """
-    # First try direct lookup by name in cached containers
+    # Exact names are the common case - answer them from the index without scanning
+    if by_name:
+        container = by_name.get(container_ref)
+        if container is not None:
+            return container
+    
+    # Then try name or ID-prefix match in cached containers
     for container in containers:
         container_id = container.id or ""
         if container.name == container_ref or container_id.startswith(container_ref):
             return container
     
     # Fallback: try client.containers.get() for short IDs or edge cases
+    from docker.errors import NotFound, APIError
+
     try:
         return client.containers.get(container_ref)
     except (NotFound, APIError):
@@ -48,7 +62,8 @@ def invoke_with_container_resolution(
     probe_func: Callable[..., Any],
     args: Dict[str, Any],
     client: Optional[DockerClient] = None,
-    containers: Optional[List[Container]] = None
+    containers: Optional[List[Container]] = None,
+    by_name: Optional[Dict[str, Container]] = None
 ) -> ProbeResult:
     """Invoke a probe with automatic container resolution.
     
@@ -61,6 +76,7 @@ def invoke_with_container_resolution(
         args: Dictionary of arguments to pass to the probe
         client: Docker client for container resolution
         containers: List of available containers for resolution
+        by_name: Optional name -> Container index for O(1) name resolution
         
     Returns:
         ProbeResult object. If an error occurs (container not found,
@@ -83,14 +99,16 @@ def invoke_with_container_resolution(
                 data={}
             )
         
-        resolved_container = resolve_container(client, containers, container_ref)
+        resolved_container = resolve_container(client, containers, container_ref, by_name)
         if not resolved_container:
+            # The index keys are already the container names, in discovery order
+            available = list(by_name) if by_name else [c.name for c in containers]
             # Return ProbeResult with error instead of raising exception
             return ProbeResult(
                 probe_name=args.get("probe_name", "unknown"),
                 success=False,
                 error=f"Container '{container_ref}' not found",
-                data={"available_containers": [c.name for c in containers]}
+                data={"available_containers": available}
             )
         
         resolved_args["container"] = resolved_container
@@ -24,6 +24,9 @@ class ProbeSpec(BaseModel):
         required_args: Set of argument names that must be provided
         example: Example JSON showing how to call the probe
         tags: Additional categorization tags for probe selection
+        requires: Optional prerequisite probe name
+        transform: Turns the prerequisite's result into args for this probe
+        provides: Argument names produced by transform
     """
     model_config = ConfigDict(arbitrary_types_allowed=True, frozen=True)
     
@@ -64,6 +67,10 @@ class ProbeSpec(BaseModel):
         None,
         description="Function to transform prerequisite probe results into args"
     )
+    provides: Set[str] = Field(
+        default_factory=set,
+        description="Argument names filled in by transform (dependency is skipped if all are given)"
+    )
 
 
 # Global probe registry - populated by @probe decorator
@@ -80,6 +87,7 @@ def probe(
     example: str = "{}",
     requires: Optional[str] = None,
     transform: Optional[Callable[[Dict], Dict]] = None,
+    provides: Optional[Set[str]] = None,
 ):
     """Decorator to register a probe function with its specification.
     
@@ -109,6 +117,7 @@ def probe(
         example: JSON example
         requires: Optional prerequisite probe name
         transform: Optional transformation function for chaining
+        provides: Argument names produced by transform
     """
     def _register(fn: Callable) -> Callable:
         spec = ProbeSpec(
@@ -122,6 +131,7 @@ def probe(
             example=example,
             requires=requires,
             transform=transform,
+            provides=provides or set(),
         )
         PROBES[name] = spec
         return fn
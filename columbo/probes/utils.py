@@ -1,29 +1,49 @@
 """Utility functions for probe management, validation, and documentation."""
 
+import functools
+from types import MappingProxyType
+
 from .registry import probe_registry, PROBE_SCHEMAS
+from .spec import PROBES
 
 
 # Argument aliases for normalizing common model variations
-ARG_ALIASES = {
+ARG_ALIASES = MappingProxyType({
     "container_name": "container",
     "cmd": "command",
     "tail_lines": "tail",
     "timeout_s": "timeout",
+})
+
+# Allowed argument names per probe, frozen once the registry is populated
+_ALLOWED_KEYS_BY_PROBE = {
+    name: frozenset(schema.get("args", {})) for name, schema in PROBE_SCHEMAS.items()
 }
 
+# Probes whose found_files come from the dependency resolver, never from the LLM
+_STRIP_FOUND_FILES = frozenset(
+    name for name, spec in PROBES.items() if "found_files" in spec.provides
+)
+
 
 def build_tools_spec(excluded_probes: set = None):
     """Build comprehensive tools specification from PROBE_SCHEMAS.
     
+    The registry is fixed after import, so the spec is cached per set of
+    excluded probes and repeated calls return the same string.
+    
     Args:
         excluded_probes: Set of probe names to exclude from the spec (for scenario-specific restrictions)
     
     Returns:
         Formatted markdown string with all probe details for LLM consumption.
     """
-    if excluded_probes is None:
-        excluded_probes = set()
-    
+    return _build_tools_spec(frozenset(excluded_probes or ()))
+
+
+@functools.lru_cache(maxsize=16)
+def _build_tools_spec(excluded_probes: frozenset) -> str:
+    """Render the tools spec for a (hashable) set of excluded probes."""
     lines = ["# Available Diagnostic Probes\n"]
     
     for name in probe_registry.keys():
@@ -106,12 +126,12 @@ def sanitize_probe_args(probe_name: str, args: dict) -> dict:
         normalized[ARG_ALIASES.get(k, k)] = v
 
     # keep only allowed keys (if schema exists)
-    allowed = set(PROBE_SCHEMAS.get(probe_name, {}).get("args", {}).keys())
+    allowed = _ALLOWED_KEYS_BY_PROBE.get(probe_name)
     if allowed:
         normalized = {k: v for k, v in normalized.items() if k in allowed}
 
     # Important: ignore LLM-provided found_files, rely on dependency resolver
-    if probe_name in {"env_files_parsing", "docker_compose_parsing", "generic_config_parsing"}:
+    if probe_name in _STRIP_FOUND_FILES:
         normalized.pop("found_files", None)
 
     return normalized
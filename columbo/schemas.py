@@ -251,13 +251,18 @@ class ProbeCall(BaseModel):
         """Whether probe executed successfully."""
         return self.error is None
 
-    def compute_signature(self) -> str:
-        """Generate deterministic signature for caching/deduplication."""
+    @staticmethod
+    def signature_for(probe_name: str, probe_args: Dict[str, Any]) -> str:
+        """Signature of a probe name + args, without building a ProbeCall."""
         # Sort args for consistency
-        sorted_args = json.dumps(self.probe_args, sort_keys=True)
-        sig_str = f"{self.probe_name}:{sorted_args}"
+        sorted_args = json.dumps(probe_args, sort_keys=True)
+        sig_str = f"{probe_name}:{sorted_args}"
         return hashlib.sha256(sig_str.encode()).hexdigest()[:12]
 
+    def compute_signature(self) -> str:
+        """Generate deterministic signature for caching/deduplication."""
+        return self.signature_for(self.probe_name, self.probe_args)
+
 class Finding(BaseModel):
     """A small, human-readable piece of evidence extracted from raw probe output."""
     model_config = ConfigDict(extra="forbid")
@@ -7,14 +7,143 @@ from rich.progress import Progress, SpinnerColumn, TextColumn, BarColumn
 from rich.table import Table
 from rich.text import Text
 from rich.console import Console, Group
-from typing import Optional, List, Dict, Any
+from typing import Optional, List, Dict, Any, Deque, Tuple
+from collections import deque
 from datetime import datetime
 from columbo.schemas import DebugSession, ProbeCall, Finding, ConfidenceLevel
+import os
 import sys
-import io
 import re
 
 
+# "H1:", "H2:", "H10:" etc prefixes the LLM puts in front of hypothesis statements
+_HYP_PREFIX_RE = re.compile(r'^H\d+:\s*')
+
+# Natural break points for truncating hypothesis text (dash, em-dash, comma, semicolon)
+_BREAK_DELIMITER_RE = re.compile(r' — | - |, |; ')
+
+# Break points for truncating long finding summaries, in order of preference
+_SUMMARY_DELIMITERS = ('. ', '\n', '; ', ', ')
+_SUMMARY_DELIMITER_RE = re.compile('|'.join(map(re.escape, _SUMMARY_DELIMITERS)))
+
+# Any run of whitespace, collapsed when compacting probe args for display
+_WHITESPACE_RE = re.compile(r'\s+')
+
+# Number of recent probes shown in the history panel
+_PROBE_HISTORY_ROWS = 10
+
+# Hypothesis confidence -> display style / badge
+_CONFIDENCE_STYLES = {
+    "high": "red",
+    "medium": "yellow",
+    "low": "blue",
+}
+_CONFIDENCE_BADGES = {
+    "high": "🔴",
+    "medium": "🟡",
+    "low": "🔵",
+}
+
+# Finding severity -> display emoji / style
+_SEVERITY_EMOJIS = {
+    'critical': '🔴',
+    'warning': '🟡',
+    'info': 'ℹ️',
+}
+_SEVERITY_STYLES = {
+    'critical': 'bold red',
+    'warning': 'bold yellow',
+    'info': 'bold green',
+}
+
+# Probe history status cells (only two possible values)
+_STATUS_OK = "[green]✓[/green]"
+_STATUS_FAIL = "[red]✗[/red]"
+
+# Live refresh rates: full speed while probes execute, slower while waiting on the LLM
+_ACTIVE_REFRESH_PER_SECOND = 4
+_IDLE_REFRESH_PER_SECOND = 1
+
+
+
+def _format_hypothesis(hyp: Dict[str, Any]) -> Tuple[str, str]:
+    """Format a hypothesis as a (style, badge + truncated description) display pair."""
+    confidence = hyp.get("confidence", "").lower()
+    conf_style = _CONFIDENCE_STYLES.get(confidence, "white")
+    conf_badge = _CONFIDENCE_BADGES.get(confidence, "⚪")
+    
+    # Clean up description - remove "H1:", "H2:", "H10:" etc prefixes if present
+    desc = hyp.get('description', 'Unknown')
+    desc = _HYP_PREFIX_RE.sub('', desc.strip())
+    
+    # Truncate for display - aim for ~110 chars max to show more context
+    # First, try to find a natural break point (dash, comma, em-dash)
+    truncate_at = 110
+    match = _BREAK_DELIMITER_RE.search(desc, 31, truncate_at)
+    if match:
+        desc = desc[:match.start()]
+    elif len(desc) > truncate_at:
+        # No good delimiter, just hard truncate at word boundary
+        desc = desc[:truncate_at].rsplit(' ', 1)[0] + "..."
+    
+    return conf_style, f"{conf_badge} {desc}"
+
+
+def _compact_probe_args(probe_args: Any) -> Text:
+    """Collapse probe args onto one line, truncated to 50 terminal cells."""
+    # Compact args display - collapse all whitespace runs (incl. newlines) to one space
+    args_text = Text(_WHITESPACE_RE.sub(' ', str(probe_args)), style="dim")
+    # Rich measures cell width, so wide characters can't push the line past 50 columns
+    args_text.truncate(50, overflow="ellipsis")
+    return args_text
+
+
+def _truncate_expected(exp: str) -> str:
+    """Keep the first 2 sentences of an expected signal, up to 180 chars."""
+    sentences = exp.split('. ')
+    if len(sentences) >= 2:
+        # Take first 2 sentences
+        exp = sentences[0] + '. ' + sentences[1]
+        if not exp.endswith('.'):
+            exp += '.'
+        if len(exp) > 180:
+            exp = exp[:177] + "..."
+    elif len(exp) > 180:
+        exp = exp[:177] + "..."
+    return exp
+
+
+def _truncate_reasoning(reasoning: str) -> str:
+    """Limit stop-decision reasoning to ~200 chars, preferring a sentence break."""
+    if len(reasoning) > 200:
+        # Look for last complete sentence within 200 chars
+        truncate_pos = 200
+        last_period = reasoning.rfind('. ', 0, truncate_pos)
+        if last_period > 100:  # Use sentence break if it's not too early
+            reasoning = reasoning[:last_period + 1]
+        else:
+            # No good sentence break, just truncate with ellipsis
+            reasoning = reasoning[:197] + "..."
+    return reasoning
+
+
+def _truncate_summary(summary: str) -> str:
+    """Truncate unusually long (> 300 chars) finding summaries at a natural break."""
+    # With concise summaries (~120 chars), less truncation needed
+    if len(summary) > 300:
+        truncate_pos = 280
+        # One scan of the window records the last position of each delimiter,
+        # then the most preferred delimiter found wins
+        last_pos = {
+            m.group(): m.start()
+            for m in _SUMMARY_DELIMITER_RE.finditer(summary, 200, truncate_pos)
+        }
+        for delimiter in _SUMMARY_DELIMITERS:
+            if delimiter in last_pos:
+                return summary[:last_pos[delimiter] + len(delimiter)] + "..."
+        return summary[:280] + "..."
+    return summary
+
 class SuppressOutput:
     """Context manager to suppress print statements during UI mode."""
     
@@ -22,23 +151,34 @@ class SuppressOutput:
         self.suppress = suppress
         self.original_stdout = None
         self.original_stderr = None
+        self._devnull = None
         
     def __enter__(self):
         if self.suppress:
             self.original_stdout = sys.stdout
             self.original_stderr = sys.stderr
-            sys.stdout = io.StringIO()
-            sys.stderr = io.StringIO()
+            # Discard output instead of buffering it in memory nobody reads
+            self._devnull = open(os.devnull, "w")
+            sys.stdout = self._devnull
+            sys.stderr = self._devnull
         return self
     
     def __exit__(self, exc_type, exc_val, exc_tb):
         if self.suppress:
             sys.stdout = self.original_stdout
             sys.stderr = self.original_stderr
+            if self._devnull:
+                self._devnull.close()
+                self._devnull = None
 
 
 class ColumboUI:
-    """Interactive Terminal UI for watching Columbo investigate."""
+    """Interactive Terminal UI for watching Columbo investigate.
+    
+    update_* methods only mutate state and mark the UI dirty; the Live display
+    pulls a fresh render on its next refresh tick, so a burst of updates within
+    one step costs a single render.
+    """
     
     def __init__(self, max_steps: int = 10, verbose: bool = False):
         self.console = Console()
@@ -47,12 +187,16 @@ class ColumboUI:
         self.current_step = 0
         self.current_activity = "Initializing..."
         self.hypotheses: List[Dict[str, Any]] = []  # Store all hypotheses
-        self.latest_finding = None
-        self.probe_history: List[Dict[str, Any]] = []
+        self.latest_finding: Optional[Finding] = None
+        self.probe_history: Deque[Dict[str, Any]] = deque(maxlen=_PROBE_HISTORY_ROWS)
         self.confidence = "unknown"
         self.current_probe_plan = None  # Store current probe plan details
         self.stop_decision = None  # Store stop decision info
         
+        # Display-ready strings, truncated once when the underlying state changes
+        self._display_hypotheses: List[Tuple[str, str]] = []
+        self._display_reasoning = ""
+        
         # Progress tracking
         self.progress = Progress(
             SpinnerColumn(),
@@ -78,17 +222,50 @@ class ColumboUI:
             Layout(name="evidence", ratio=2),
         )
         
+        # Header is static, so it is built once here
+        self.layout["header"].update(
+            Panel(
+                Text("🕵️  Columbo Root Cause Explorer", style="bold cyan", justify="center"),
+                style="bold white on blue"
+            )
+        )
+        
+        # Persistent panels - render() only swaps their contents
+        self._inv_panel = Panel("", title="🔍 Active Investigation", border_style="cyan")
+        self._evidence_panel = Panel(
+            Text("No evidence yet...", style="dim"),  # Placeholder until the first finding
+            title="📊 Evidence",
+            border_style="green"
+        )
+        self._history_panel = Panel("", title="📝 Probe History", border_style="magenta")
+        # Footer with progress; update_confidence swaps in a new confidence line
+        self._confidence_text = Text(f"Confidence: {self.confidence}", style="bold yellow")
+        self._footer_panel = Panel(
+            Group(self.progress, self._confidence_text),
+            style="bold white on dark_blue"
+        )
+        self.layout["investigation"].update(self._inv_panel)
+        self.layout["evidence"].update(self._evidence_panel)
+        self.layout["right"].update(self._history_panel)
+        self.layout["footer"].update(self._footer_panel)
+        self._history_table = self._build_history_table()
+        self._history_panel.renderable = self._history_table
+        
         self.live = None
+        self._dirty = True  # Set by update_* methods, cleared on render
+        self._inv_key = None  # Inputs the investigation body was last built from
     
     def start(self):
         """Start the live UI display."""
         self.progress_task = self.progress.add_task(
             "Investigation Budget Consumed", total=self.max_steps
         )
+        # Live pulls the layout on each refresh tick; updates only mark state dirty
+        # so bursts of update_* calls collapse into a single render
         self.live = Live(
-            self.render(), 
             console=self.console, 
-            refresh_per_second=4,
+            refresh_per_second=_ACTIVE_REFRESH_PER_SECOND,
+            get_renderable=self._maybe_render,
             screen=True,  # Use alternate screen buffer for isolated UI
             redirect_stderr=False,  # Allow errors to still show
         )
@@ -99,302 +276,242 @@ class ColumboUI:
         if self.live:
             self.live.stop()
     
+    def _build_history_table(self) -> Table:
+        """Build the probe history table from the bounded history deque."""
+        history_table = Table(show_header=True, header_style="bold magenta", box=None)
+        history_table.add_column("Step", style="dim", width=5)
+        history_table.add_column("Probe", style="cyan")
+        history_table.add_column("Status", width=8)
+        
+        for probe in self.probe_history:  # Deque keeps only the last rows shown
+            self._add_history_row(history_table, probe)
+        
+        return history_table
+    
+    @staticmethod
+    def _add_history_row(history_table: Table, probe: Dict[str, Any]):
+        """Append one probe execution as a row of the history table."""
+        history_table.add_row(
+            str(probe["step"]),
+            probe["name"][:30],
+            _STATUS_OK if probe.get("success", True) else _STATUS_FAIL
+        )
+    
+    def _set_refresh_rate(self, refresh_per_second: float):
+        """Change the auto-refresh rate of the running Live display."""
+        if not self.live:
+            return
+        self.live.refresh_per_second = refresh_per_second
+        # Live's refresh thread keeps its own copy of the rate
+        refresh_thread = getattr(self.live, "_refresh_thread", None)
+        if refresh_thread is not None:
+            refresh_thread.refresh_per_second = refresh_per_second
+    
+    def _maybe_render(self) -> Layout:
+        """Return the layout, re-rendering only if state changed since last tick."""
+        if self._dirty:
+            return self.render()
+        return self.layout
+    
     def render(self) -> Layout:
         """Render the current UI state."""
-        # Header
-        self.layout["header"].update(
-            Panel(
-                Text("🕵️  Columbo Root Cause Explorer", style="bold cyan", justify="center"),
-                style="bold white on blue"
-            )
+        self._dirty = False
+        # Investigation panel - only rebuilt when its inputs changed (e.g. not when
+        # a probe result or confidence update triggered this render)
+        inv_key = (
+            self.current_step,
+            self.current_activity,
+            len(self.hypotheses),
+            self._display_hypotheses,
+            self.current_probe_plan,
+            self.stop_decision,
+            self._display_reasoning,
         )
+        if inv_key != self._inv_key:
+            self._inv_key = inv_key
+            self._inv_panel.renderable = self._render_investigation()
         
-        # Investigation panel
-        inv_content = []
-        inv_content.append(f"[bold]Step {self.current_step}/{self.max_steps}[/bold]")
+        return self.layout
+    
+    def _render_investigation(self) -> Text:
+        """Build the investigation panel body as styled Text (no markup parsing)."""
+        inv_content = Text()
+        inv_content.append(f"Step {self.current_step}/{self.max_steps}", style="bold")
         
         # Only show activity if we're not done (don't duplicate stop decision)
         if not self.stop_decision:
-            inv_content.append(f"[yellow]⚙ {self.current_activity}[/yellow]")
+            inv_content.append(f"\n⚙ {self.current_activity}", style="yellow")
         
         # Show hypotheses first (more important than probe plan)
         if self.hypotheses:
-            inv_content.append("")
-            inv_content.append(f"[bold cyan]Active Hypotheses ({len(self.hypotheses)}):[/bold cyan]")
+            inv_content.append("\n\n")
+            inv_content.append(f"Active Hypotheses ({len(self.hypotheses)}):", style="bold cyan")
             # Show top 3 most likely hypotheses only
-            for i, hyp in enumerate(self.hypotheses[:3], 1):
-                conf_style = {
-                    "high": "red",
-                    "medium": "yellow", 
-                    "low": "blue"
-                }.get(hyp.get("confidence", "").lower(), "white")
-                
-                # Clean up description - remove "H1:", "H2:", "H10:" etc prefixes if present
-                desc = hyp.get('description', 'Unknown')
-                desc = desc.strip()
-                desc = re.sub(r'^H\d+:\s*', '', desc)
-                
-                # Truncate for display - aim for ~110 chars max to show more context
-                # First, try to find a natural break point (dash, comma, em-dash)
-                truncate_at = 110
-                for delimiter in [' — ', ' - ', ', ', '; ']:
-                    pos = desc.find(delimiter)
-                    if 30 < pos < truncate_at:
-                        desc = desc[:pos]
-                        break
-                else:
-                    # No good delimiter, just hard truncate at word boundary
-                    if len(desc) > truncate_at:
-                        desc = desc[:truncate_at].rsplit(' ', 1)[0] + "..."
-                
-                conf_badge = {
-                    "high": "🔴",
-                    "medium": "🟡",
-                    "low": "🔵"
-                }.get(hyp.get("confidence", "").lower(), "⚪")
-                
+            for conf_style, line in self._display_hypotheses:
                 # Single line display to avoid awkward wrapping
-                hyp_text = f"  [{conf_style}]{conf_badge} {desc}[/{conf_style}]"
-                inv_content.append(hyp_text)
+                inv_content.append("\n  ")
+                inv_content.append(line, style=conf_style)
             
             if len(self.hypotheses) > 3:
-                inv_content.append(f"  [dim]...and {len(self.hypotheses) - 3} more[/dim]")
+                inv_content.append("\n  ")
+                inv_content.append(f"...and {len(self.hypotheses) - 3} more", style="dim")
         
         # Show current probe plan after hypotheses (but not if we've decided to stop)
         if self.current_probe_plan and not self.stop_decision:
-            inv_content.append("")
-            inv_content.append(f"[bold magenta]📋 Next Probe:[/bold magenta]")
+            inv_content.append("\n\n")
+            inv_content.append("📋 Next Probe:", style="bold magenta")
             
             # Show probe name and args on same line
-            probe_name = self.current_probe_plan['name']
-            args_str = str(self.current_probe_plan.get('args', '{}'))
-            # Compact args display - remove extra whitespace
-            args_str = args_str.replace('\n', ' ').replace('  ', ' ')
-            if len(args_str) > 50:
-                args_str = args_str[:47] + "..."
-            inv_content.append(f"  [cyan]{probe_name}[/cyan] [dim]{args_str}[/dim]")
+            inv_content.append("\n  ")
+            inv_content.append(self.current_probe_plan['name'], style="cyan")
+            inv_content.append(" ")
+            inv_content.append(self.current_probe_plan['args_display'])
             
             # Show expected signal as rationale
-            if self.current_probe_plan.get('expected'):
-                exp = self.current_probe_plan['expected']
-                # Allow more space - keep first 2 sentences or up to 180 chars
-                sentences = exp.split('. ')
-                if len(sentences) >= 2:
-                    # Take first 2 sentences
-                    exp = sentences[0] + '. ' + sentences[1]
-                    if not exp.endswith('.'):
-                        exp += '.'
-                    if len(exp) > 180:
-                        exp = exp[:177] + "..."
-                elif len(exp) > 180:
-                    exp = exp[:177] + "..."
-                inv_content.append(f"  [dim]Why: {exp}[/dim]")
+            if self.current_probe_plan['expected_display']:
+                inv_content.append("\n  ")
+                inv_content.append(f"Why: {self.current_probe_plan['expected_display']}", style="dim")
         
         # Show stop decision if available (at the end for better flow)
         if self.stop_decision:
-            inv_content.append("")
-            inv_content.append("[bold]Decision:[/bold]")
-            reasoning = self.stop_decision['reasoning']
-            
-            # Allow up to 200 chars for stop decision (it's important context)
-            # Try to break at sentence boundary if needed
-            if len(reasoning) > 200:
-                # Look for last complete sentence within 200 chars
-                truncate_pos = 200
-                last_period = reasoning.rfind('. ', 0, truncate_pos)
-                if last_period > 100:  # Use sentence break if it's not too early
-                    reasoning = reasoning[:last_period + 1]
-                else:
-                    # No good sentence break, just truncate with ellipsis
-                    reasoning = reasoning[:197] + "..."
-            
+            inv_content.append("\n\n")
+            inv_content.append("Decision:", style="bold")
+            inv_content.append("\n  ")
             if self.stop_decision["should_stop"]:
-                inv_content.append(f"  [bold red]🛑 Stop:[/bold red] {reasoning}")
+                inv_content.append("🛑 Stop:", style="bold red")
             else:
-                inv_content.append(f"  [bold green]▶ Continue:[/bold green] {reasoning}")
-        
-        self.layout["investigation"].update(
-            Panel(
-                "\n".join(inv_content),
-                title="🔍 Active Investigation",
-                border_style="cyan"
-            )
-        )
-        
-        # Evidence panel
-        if self.latest_finding:
-            summary = self.latest_finding['summary']
-            severity = self.latest_finding.get('severity', 'info')
-            
-            # Severity styling
-            severity_emoji = {
-                'critical': '🔴',
-                'warning': '🟡',
-                'info': 'ℹ️'
-            }.get(severity, 'ℹ️')
-            
-            severity_style = {
-                'critical': 'bold red',
-                'warning': 'bold yellow',
-                'info': 'bold green'
-            }.get(severity, 'bold green')
-            
-            # With concise summaries (~120 chars), less truncation needed
-            # Only truncate if unusually long (> 300 chars)
-            if len(summary) > 300:
-                truncate_pos = 280
-                for delimiter in ['. ', '\n', '; ', ', ']:
-                    pos = summary.rfind(delimiter, 200, truncate_pos)
-                    if pos > 0:
-                        summary = summary[:pos + len(delimiter)] + "..."
-                        break
-                else:
-                    summary = summary[:280] + "..."
-            
-            evidence_parts = [
-                Text(f"{severity_emoji} Latest Finding:", style=severity_style),
-                Text(""),
-                Text(summary)
-            ]
-            
-            self.layout["evidence"].update(
-                Panel(
-                    Group(*evidence_parts),
-                    title="📊 Evidence",
-                    border_style="green"
-                )
-            )
-        else:
-            self.layout["evidence"].update(
-                Panel(
-                    "[dim]No evidence yet...[/dim]",
-                    title="📊 Evidence",
-                    border_style="green"
-                )
-            )
-        
-        # Probe history table
-        history_table = Table(show_header=True, header_style="bold magenta", box=None)
-        history_table.add_column("Step", style="dim", width=5)
-        history_table.add_column("Probe", style="cyan")
-        history_table.add_column("Status", width=8)
-        
-        for probe in self.probe_history[-10:]:  # Show last 10
-            status_emoji = "✓" if probe.get("success", True) else "✗"
-            status_style = "green" if probe.get("success", True) else "red"
-            history_table.add_row(
-                str(probe["step"]),
-                probe["name"][:30],
-                f"[{status_style}]{status_emoji}[/{status_style}]"
-            )
-        
-        self.layout["right"].update(
-            Panel(
-                history_table,
-                title="📝 Probe History",
-                border_style="magenta"
-            )
-        )
+                inv_content.append("▶ Continue:", style="bold green")
+            inv_content.append(f" {self._display_reasoning}")
         
-        # Footer with progress
-        footer_group = Group(
-            self.progress,
-            Text(f"Confidence: {self.confidence}", style="bold yellow")
-        )
-        self.layout["footer"].update(Panel(footer_group, style="bold white on dark_blue"))
-        
-        return self.layout
+        return inv_content
     
     def update_step(self, step: int):
         """Update current step number."""
+        if step == self.current_step:
+            return
         self.current_step = step
         # Clear only probe plan from previous step
         # Keep stop decision visible as context for why we're continuing
         self.current_probe_plan = None
         if self.progress_task is not None:
             self.progress.update(self.progress_task, completed=step)
-        if self.live:
-            self.live.update(self.render())
+        self._dirty = True
     
     def update_activity(self, activity: str):
         """Update current activity description."""
+        if activity == self.current_activity:
+            return
         self.current_activity = activity
-        if self.live:
-            self.live.update(self.render())
+        # Only probe execution changes state quickly; LLM phases just spin
+        if activity.startswith("Executing"):
+            self._set_refresh_rate(_ACTIVE_REFRESH_PER_SECOND)
+        else:
+            self._set_refresh_rate(_IDLE_REFRESH_PER_SECOND)
+        self._dirty = True
     
     def update_hypotheses(self, hypotheses: List[Dict[str, Any]]):
         """Update all active hypotheses."""
+        # Identical hypotheses with nothing to clear change nothing on screen
+        # (the same list object may have been mutated in place, so always re-format it)
+        if (hypotheses is not self.hypotheses and hypotheses == self.hypotheses
+                and self.stop_decision is None):
+            return
         self.hypotheses = hypotheses
+        # Show top 3 most likely hypotheses only, formatted once per update
+        self._display_hypotheses = [_format_hypothesis(hyp) for hyp in hypotheses[:3]]
         # Clear previous stop decision now that we have new hypotheses (new round of thinking)
         self.stop_decision = None
-        if self.live:
-            self.live.update(self.render())
+        self._dirty = True
     
     def update_probe_plan(self, probe_name: str, probe_args: str, expected_signal: str):
         """Update the current probe plan being executed."""
+        # Display strings only change here, so format once instead of per render
         self.current_probe_plan = {
             "name": probe_name,
-            "args": probe_args,
-            "expected": expected_signal
+            "args_display": _compact_probe_args(probe_args),
+            "expected_display": _truncate_expected(expected_signal) if expected_signal else "",
         }
-        if self.live:
-            self.live.update(self.render())
+        self._dirty = True
     
     def add_probe_execution(self, step: int, probe_name: str, success: bool = True):
         """Add a probe to the execution history."""
-        self.probe_history.append({
+        probe = {
             "step": step,
             "name": probe_name,
             "success": success,
-        })
-        if self.live:
-            self.live.update(self.render())
+        }
+        self.probe_history.append(probe)
+        # History only changes here. Live's refresh thread may be rendering the current
+        # table, so build a new one (a few rows) and swap it in rather than mutating it
+        self._history_table = self._build_history_table()
+        self._history_panel.renderable = self._history_table
+        self._dirty = True
     
-    def update_finding(self, finding: Dict[str, Any]):
+    def update_finding(self, finding: Finding):
         """Update the latest finding."""
+        if finding == self.latest_finding:
+            return
         self.latest_finding = finding
-        if self.live:
-            self.live.update(self.render())
+        
+        # The evidence body only depends on the finding, so build it here, not per render
+        severity = finding.severity.value
+        self._evidence_panel.renderable = Group(
+            Text(f"{_SEVERITY_EMOJIS.get(severity, 'ℹ️')} Latest Finding:",
+                 style=_SEVERITY_STYLES.get(severity, 'bold green')),
+            Text(""),
+            Text(_truncate_summary(finding.summary)),
+        )
+        self._dirty = True
     
     def update_confidence(self, confidence: str):
         """Update confidence level."""
+        if confidence == self.confidence:
+            return
         self.confidence = confidence
-        if self.live:
-            self.live.update(self.render())
+        # Swap in a new footer body instead of editing the Text the refresh thread may be rendering
+        self._confidence_text = Text(f"Confidence: {confidence}", style="bold yellow")
+        self._footer_panel.renderable = Group(self.progress, self._confidence_text)
+        self._dirty = True
     
     def update_stop_decision(self, should_stop: bool, reasoning: str, confidence: str):
         """Update stop decision information."""
-        self.stop_decision = {
+        stop_decision = {
             "should_stop": should_stop,
             "reasoning": reasoning,
             "confidence": confidence
         }
-        if self.live:
-            self.live.update(self.render())
+        if stop_decision == self.stop_decision:
+            return
+        self.stop_decision = stop_decision
+        # Allow up to 200 chars for stop decision (it's important context)
+        self._display_reasoning = _truncate_reasoning(reasoning)
+        self._dirty = True
     
     def show_final_diagnosis(self, diagnosis: Dict[str, Any]):
         """Display final diagnosis in a formatted panel."""
         self.stop()
         
-        # Create diagnosis panel
-        diag_content = []
-        diag_content.append(f"[bold red]Root Cause:[/bold red]")
-        diag_content.append(f"  {diagnosis.get('root_cause', 'Unknown')}")
-        diag_content.append("")
-        diag_content.append(f"[bold green]Recommended Fixes:[/bold green]")
-        diag_content.append(f"  {diagnosis.get('recommended_fixes', 'None provided')}")
-        diag_content.append("")
-        diag_content.append(f"[bold yellow]Confidence:[/bold yellow] {diagnosis.get('confidence', 'unknown')}")
+        # Create diagnosis panel; LLM text goes in plain Text so stray [brackets] aren't parsed as markup
+        diag_content = [
+            Text("Root Cause:", style="bold red"),
+            Text(f"  {diagnosis.get('root_cause', 'Unknown')}"),
+            Text(""),
+            Text("Recommended Fixes:", style="bold green"),
+            Text(f"  {diagnosis.get('recommended_fixes', 'None provided')}"),
+            Text(""),
+            Text.assemble(("Confidence:", "bold yellow"), f" {diagnosis.get('confidence', 'unknown')}"),
+        ]
         
-        if diagnosis.get('additional_notes'):
-            diag_content.append("")
-            diag_content.append(f"[bold cyan]Additional Notes:[/bold cyan]")
-            diag_content.append(f"  {diagnosis['additional_notes']}")
+        additional_notes = diagnosis.get('additional_notes')
+        if additional_notes:
+            diag_content.append(Text(""))
+            diag_content.append(Text("Additional Notes:", style="bold cyan"))
+            diag_content.append(Text(f"  {additional_notes}"))
         
         self.console.print()
         self.console.print(
             Panel(
-                "\n".join(diag_content),
+                Group(*diag_content),
                 title="🎯 Final Diagnosis",
                 border_style="bold green",
                 expand=False,
@@ -417,6 +534,8 @@ class SimpleProgressUI:
             console=self.console,
         )
         self.task = None
+        self._last_step = None
+        self._last_activity = None
     
     def start(self):
         """Start progress tracking."""
@@ -429,12 +548,14 @@ class SimpleProgressUI:
     
     def update_step(self, step: int):
         """Update progress."""
-        if self.task is not None:
+        if self.task is not None and step != self._last_step:
+            self._last_step = step
             self.progress.update(self.task, completed=step)
     
     def update_activity(self, activity: str):
         """Update activity description."""
-        if self.task is not None:
+        if self.task is not None and activity != self._last_activity:
+            self._last_activity = activity
             self.progress.update(self.task, description=f"[bold blue]{activity}")
     
     def show_final_diagnosis(self, diagnosis: Dict[str, Any]):
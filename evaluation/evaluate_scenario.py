@@ -49,19 +49,20 @@ from evaluation.metrics import (
 )
 
 
-def setup_dspy_llm(api_key: str, model: str = None):
+def setup_dspy_llm(api_key: str, model: str = None, cache: bool = False):
     """Configure DSPy with your LLM of choice.
     
     Args:
         api_key: LLM API key
         model: Model name (defaults to COLUMBO_MODEL env var or 'openai/gpt-5-mini')
+        cache: Reuse DSPy's on-disk cache of LLM responses for identical prompts
     """
     if model is None:
         model = os.getenv("COLUMBO_MODEL", "openai/gpt-5-mini")
     
     # gpt-5 models only support temperature=1
     temperature = 1.0 if "gpt-5" in model else 0.0
-    lm = dspy.LM(model, api_key=api_key, cache=False, temperature=temperature)
+    lm = dspy.LM(model, api_key=api_key, cache=cache, temperature=temperature)
     dspy.configure(lm=lm)
 
 
@@ -104,6 +105,11 @@ def main():
         action="store_true",
         help="Enable MLflow experiment tracking (requires: poetry install --with evaluation)"
     )
+    parser.add_argument(
+        "--llm-cache",
+        action="store_true",
+        help="Replay cached LLM responses for identical prompts (fast re-runs; results are not independent samples)"
+    )
     
     args = parser.parse_args()
     
@@ -119,7 +125,7 @@ def main():
         print("ERROR: OPENAI_API_KEY not set in environment")
         return 1
     
-    setup_dspy_llm(api_key=openai_api_key)
+    setup_dspy_llm(api_key=openai_api_key, cache=args.llm_cache)
     
     # Initialize MLflow tracking if requested and available
     mlflow_enabled = False
@@ -351,6 +357,7 @@ def main():
                 mlflow.log_param("max_steps", manifest.budgets['max_steps'])
                 mlflow.log_param("optimal_steps", manifest.budgets['optimal_steps'])
                 mlflow.log_param("llm_model", "gpt-5-mini")  # Could make this configurable
+                mlflow.log_param("llm_cache", args.llm_cache)
                 
                 # Log metrics
                 mlflow.log_metric("probe_recall", probe_recall.recall)
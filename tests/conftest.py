@@ -1,5 +1,9 @@
 """Pytest configuration and shared fixtures."""
 
+import socket
+import threading
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
 import pytest
 from pathlib import Path
 from datetime import datetime
@@ -78,3 +82,38 @@ def temp_session_dir(tmp_path):
     session_dir = tmp_path / "test_sessions"
     session_dir.mkdir()
     return session_dir
+
+
+class _OkHandler(BaseHTTPRequestHandler):
+    """Answer every GET with 200 and a short body."""
+    
+    def do_GET(self):
+        body = b"ok"
+        self.send_response(200)
+        self.send_header("Content-Length", str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+    
+    def log_message(self, *args):
+        pass
+
+
+@pytest.fixture
+def local_http_port():
+    """Serve HTTP on a local listening socket and return its port."""
+    server = ThreadingHTTPServer(("127.0.0.1", 0), _OkHandler)
+    thread = threading.Thread(target=server.serve_forever, daemon=True)
+    thread.start()
+    yield server.server_address[1]
+    server.shutdown()
+    server.server_close()
+
+
+@pytest.fixture
+def closed_port():
+    """Return a local port that nothing is listening on."""
+    sock = socket.socket()
+    sock.bind(("127.0.0.1", 0))
+    port = sock.getsockname()[1]
+    sock.close()
+    return port
@@ -7,8 +7,18 @@ These tests verify that:
 """
 
 import pytest
+import yaml
+from unittest.mock import Mock
 from columbo.probes.spec import ProbeSpec, probe, PROBES
 from columbo.probes.registry import probe_registry, PROBE_SCHEMAS
+from columbo.probes.runtime import resolve_container
+from columbo.probes.container_probes import containers_state_probe, container_logs_probe
+from columbo.probes.config_probes import docker_compose_parsing_probe, env_files_parsing_probe
+from columbo.probes.network_probes import (
+    network_triage_probe,
+    tcp_connection_batch_probe,
+    http_connection_batch_probe,
+)
 from columbo.schemas import ProbeResult
 
 
@@ -167,6 +177,32 @@ class TestBuiltInProbes:
             assert probe_name in PROBES, f"Expected probe {probe_name} not found"
             assert probe_name in probe_registry
     
+    def test_network_triage_registered(self):
+        """Test that the network triage probe is registered with its metadata."""
+        assert "network_triage" in PROBES
+        assert "network_triage" in probe_registry
+        spec = PROBES["network_triage"]
+        assert spec.scope == "network"
+        assert {"dns", "tcp", "http"} <= spec.tags
+        assert spec.required_args == {"host"}
+        assert set(spec.args) == {"host", "ports", "paths", "timeout"}
+    
+    def test_connection_batch_probes_registered(self):
+        """Test that the batch connection probes are registered with their metadata."""
+        expected = {
+            "tcp_connection_batch": ({"tcp"}, {"targets"}),
+            "http_connection_batch": ({"http"}, {"urls"}),
+        }
+        
+        for probe_name, (tags, required_args) in expected.items():
+            assert probe_name in PROBES, f"Expected probe {probe_name} not found"
+            assert probe_name in probe_registry
+            spec = PROBES[probe_name]
+            assert spec.scope == "network"
+            assert tags <= spec.tags
+            assert spec.required_args == required_args
+            assert set(spec.args) == required_args | {"timeout"}
+    
     def test_probe_has_required_metadata(self):
         """Test that registered probes have proper metadata."""
         # Pick a known probe to test
@@ -176,3 +212,332 @@ class TestBuiltInProbes:
             assert spec.description  # Should have a description
             assert spec.scope in ["container", "volume", "network", "config", "host"]
             assert isinstance(spec.tags, set)
+
+
+class TestContainerResolution:
+    """Test resolving container references to Container objects."""
+    
+    def _container(self, name, container_id):
+        container = Mock()
+        container.name = name
+        container.id = container_id
+        return container
+    
+    def test_resolve_by_name_index(self):
+        """Test that exact names are answered from the index."""
+        api = self._container("api", "abc123")
+        client = Mock()
+        
+        assert resolve_container(client, [api], "api", by_name={"api": api}) is api
+        client.containers.get.assert_not_called()
+    
+    def test_resolve_id_prefix_falls_back_to_scan(self):
+        """Test that ID prefixes still resolve when not in the name index."""
+        api = self._container("api", "abc123")
+        client = Mock()
+        
+        assert resolve_container(client, [api], "abc", by_name={"api": api}) is api
+        client.containers.get.assert_not_called()
+
+
+class TestEnvFileParsing:
+    """Test parsing of .env files by env_files_parsing_probe."""
+    
+    def _parse(self, tmp_path, content):
+        env_file = tmp_path / ".env"
+        env_file.write_text(content)
+        result = env_files_parsing_probe([{"absolute_path": str(env_file)}])
+        assert result.success is True
+        parsed = result.data["parsed_env_files"][0]
+        assert parsed["file_format"] == "dotenv"
+        return parsed["variables"]
+    
+    def test_simple_assignments(self, tmp_path):
+        """Test KEY=value lines, with quotes stripped from values."""
+        variables = self._parse(tmp_path, 'A=1\nB="two"\nC=\'three\'\n')
+        assert variables == {"A": "1", "B": "two", "C": "three"}
+    
+    def test_blank_lines_skipped(self, tmp_path):
+        """Test that blank and whitespace-only lines are ignored."""
+        variables = self._parse(tmp_path, "\nA=1\n\n   \nB=2\n\n")
+        assert variables == {"A": "1", "B": "2"}
+    
+    def test_comments_skipped(self, tmp_path):
+        """Test that comment lines are ignored, including ones containing '='."""
+        variables = self._parse(tmp_path, "# comment\n#C=3\n  # indented=4\nA=1\n")
+        assert variables == {"A": "1"}
+    
+    def test_leading_whitespace_stripped(self, tmp_path):
+        """Test that indentation around keys and values is dropped."""
+        variables = self._parse(tmp_path, "   A = 1  \n\tB=2\n")
+        assert variables == {"A": "1", "B": "2"}
+    
+    def test_bare_value_has_empty_key(self, tmp_path):
+        """Test that a line starting with '=' is kept under an empty key."""
+        variables = self._parse(tmp_path, "=value\n")
+        assert variables == {"": "value"}
+    
+    def test_empty_value(self, tmp_path):
+        """Test that KEY= yields an empty string."""
+        variables = self._parse(tmp_path, "KEY=\n")
+        assert variables == {"KEY": ""}
+    
+    def test_hash_inside_key(self, tmp_path):
+        """Test that '#' only starts a comment at the beginning of a line."""
+        variables = self._parse(tmp_path, "a#b=c\n")
+        assert variables == {"a#b": "c"}
+    
+    def test_split_on_first_equals(self, tmp_path):
+        """Test that values may contain '=' and lines without one are ignored."""
+        variables = self._parse(tmp_path, "URL=postgres://h/db?a=b\nnot an assignment\n")
+        assert variables == {"URL": "postgres://h/db?a=b"}
+
+
+class TestNetworkTriage:
+    """Test network_triage against local sockets."""
+    
+    def test_triage_reports_each_check(self, local_http_port, closed_port):
+        """Test that DNS, TCP and HTTP results come back per port and path."""
+        result = network_triage_probe(
+            "127.0.0.1", ports=[local_http_port, closed_port], paths=["health"], timeout=2.0
+        )
+        
+        assert result.success is True
+        assert result.data["host"] == "127.0.0.1"
+        assert result.data["dns"]["success"] is True
+        
+        tcp = result.data["tcp"]
+        assert [r["port"] for r in tcp] == [local_http_port, closed_port]
+        assert [r["ok"] for r in tcp] == [True, False]
+        assert tcp[1]["error"]
+        
+        http = result.data["http"]
+        assert [r["url"] for r in http] == [
+            f"http://127.0.0.1:{local_http_port}/health",
+            f"http://127.0.0.1:{closed_port}/health",
+        ]
+        assert http[0]["status_code"] == 200
+        assert http[0]["ok"] is True
+        assert http[1]["ok"] is False
+        assert http[1]["error"]
+    
+    def test_triage_rejects_invalid_ports(self):
+        """Test that non-numeric ports fail the probe without running checks."""
+        result = network_triage_probe("127.0.0.1", ports=["http"])
+        
+        assert result.success is False
+        assert "Invalid ports/paths" in result.error
+        assert result.data == {"host": "127.0.0.1"}
+
+
+class TestConnectionBatchProbes:
+    """Test the batch TCP/HTTP probes against local sockets."""
+    
+    def test_tcp_batch_results_in_order(self, local_http_port, closed_port):
+        """Test per-target results for every accepted target form."""
+        result = tcp_connection_batch_probe(
+            [
+                f"127.0.0.1:{local_http_port}",
+                ["127.0.0.1", closed_port],
+                {"host": "127.0.0.1", "port": local_http_port},
+            ],
+            timeout=2.0,
+        )
+        
+        assert result.success is True
+        results = result.data["results"]
+        assert [(r["host"], r["port"]) for r in results] == [
+            ("127.0.0.1", local_http_port),
+            ("127.0.0.1", closed_port),
+            ("127.0.0.1", local_http_port),
+        ]
+        assert [r["ok"] for r in results] == [True, False, True]
+        assert results[1]["success"] is False
+        assert results[1]["error"]
+        assert result.data["ok"] is False
+    
+    def test_tcp_batch_ok_when_all_connect(self, local_http_port):
+        """Test that ok is true only when every target connects."""
+        result = tcp_connection_batch_probe(f"127.0.0.1:{local_http_port}", timeout=2.0)
+        
+        assert result.success is True
+        assert len(result.data["results"]) == 1
+        assert result.data["ok"] is True
+    
+    def test_tcp_batch_invalid_targets(self):
+        """Test that malformed targets fail the probe."""
+        result = tcp_connection_batch_probe(["no-port-here"])
+        
+        assert result.success is False
+        assert "Invalid targets" in result.error
+        assert result.data == {"targets": ["no-port-here"]}
+    
+    def test_http_batch_aggregates_results(self, local_http_port, closed_port):
+        """Test per-URL results and the combined ok flag."""
+        urls = [
+            f"http://127.0.0.1:{local_http_port}/",
+            f"http://127.0.0.1:{closed_port}/",
+        ]
+        result = http_connection_batch_probe(urls, timeout=2.0)
+        
+        assert result.success is True
+        results = result.data["results"]
+        assert [r["url"] for r in results] == urls
+        assert results[0]["status_code"] == 200
+        assert results[0]["ok"] is True
+        assert results[1]["status_code"] is None
+        assert results[1]["ok"] is False
+        assert results[1]["error"]
+        assert result.data["ok"] is False
+    
+    def test_batches_with_no_targets(self):
+        """Test that empty batches succeed with no results."""
+        for result in (tcp_connection_batch_probe([]), http_connection_batch_probe([])):
+            assert result.success is True
+            assert result.data == {"results": [], "ok": True}
+
+
+class TestContainersState:
+    """Test containers_state filtering."""
+    
+    def _containers(self):
+        containers = []
+        for name, status in [("api", "running"), ("db", "exited"), ("worker", "running")]:
+            container = Mock()
+            container.name = name
+            container.status = status
+            containers.append(container)
+        return containers
+    
+    def test_includes_stopped_by_default(self):
+        """Test that every container is listed by default."""
+        result = containers_state_probe(self._containers())
+        
+        assert [c["container"] for c in result.data["containers"]] == ["api", "db", "worker"]
+        assert [c["healthy"] for c in result.data["containers"]] == [True, False, True]
+    
+    @pytest.mark.parametrize("include_stopped", [False, "false", "0"])
+    def test_running_only(self, include_stopped):
+        """Test that include_stopped=false lists only running containers."""
+        result = containers_state_probe(self._containers(), include_stopped=include_stopped)
+        
+        assert result.success is True
+        assert [c["container"] for c in result.data["containers"]] == ["api", "worker"]
+
+class TestContainerLogs:
+    """Test container_logs on streamed log output."""
+    
+    def _logs(self, container, chunks, tail):
+        container.logs = Mock(return_value=iter(chunks))
+        result = container_logs_probe(container, tail=tail)
+        assert result.success is True
+        return result.data
+    
+    def test_untruncated_stream(self, mock_docker_container):
+        """Test that a stream under the cap is returned whole."""
+        data = self._logs(mock_docker_container, [b"line 1\nli", b"ne 2\n"], tail=50)
+        
+        assert data["log_excerpt"] == "line 1\nline 2\n"
+        assert data["empty"] is False
+        assert "truncated" not in data
+    
+    def test_tail_all_is_not_capped(self, mock_docker_container):
+        """Test that tail="all" keeps every byte."""
+        lines = [b"x" * 1000 + b"\n"] * 5
+        data = self._logs(mock_docker_container, lines, tail="all")
+        
+        assert data["log_excerpt"] == (b"".join(lines)).decode()
+        assert "truncated" not in data
+    
+    def test_single_overlong_line_kept(self, mock_docker_container):
+        """Test that an overlong newest line is kept partially, not dropped."""
+        line = b'{"level": "error", "msg": "' + b"e" * 700 + b'"}\n'
+        data = self._logs(mock_docker_container, [line], tail=1)
+        
+        assert data["empty"] is False
+        assert data["truncated"] is True
+        assert line.decode().endswith(data["log_excerpt"])
+        assert data["log_excerpt"].endswith('"}\n')
+    
+    def test_cut_on_line_boundary_keeps_first_line(self, mock_docker_container):
+        """Test that a cut landing on a line start keeps that complete line."""
+        old = b"a" * 99 + b"\n"
+        kept = [b"b" * 511 + b"\n", b"c" * 511 + b"\n"]
+        data = self._logs(mock_docker_container, [old] + kept, tail=2)
+        
+        assert data["log_excerpt"] == b"".join(kept).decode()
+        assert data["truncated"] is True
+    
+    def test_cut_mid_line_drops_partial_line(self, mock_docker_container):
+        """Test that a cut landing mid-line starts at the next line."""
+        kept = b"c" * 100 + b"\n"
+        data = self._logs(mock_docker_container, [b"a" * 99 + b"\n", b"b" * 1000 + b"\n", kept], tail=2)
+        
+        assert data["log_excerpt"] == kept.decode()
+        assert data["truncated"] is True
+
+
+class TestDockerComposeParsing:
+    """Test the compact and full service views of docker_compose_parsing."""
+    
+    _COMPOSE = """
+services:
+  api:
+    image: example/api:1.0
+    command: "%s"
+    environment:
+      - LOG_LEVEL=debug
+    ports:
+      - "8000:8000"
+    depends_on:
+      - db
+    healthcheck:
+      test: ["CMD", "curl", "-f", "http://localhost:8000/health"]
+      interval: 10s
+    restart: always
+    labels:
+      team: core
+  db:
+    image: postgres:16
+""" % ("x" * 400)
+    
+    def _parse(self, tmp_path, **kwargs):
+        compose_file = tmp_path / "docker-compose.yml"
+        compose_file.write_text(self._COMPOSE)
+        result = docker_compose_parsing_probe([{"absolute_path": str(compose_file)}], **kwargs)
+        assert result.success is True
+        parsed = result.data["parsed_compose_files"][0]
+        assert parsed["parsed"] is True
+        assert parsed["service_count"] == 2
+        return parsed["services"]
+    
+    def test_summary_keeps_selected_keys(self, tmp_path):
+        """Test that the compact view keeps the diagnostic keys as-is."""
+        api = self._parse(tmp_path)["api"]
+        
+        assert api["image"] == "example/api:1.0"
+        assert api["environment"] == ["LOG_LEVEL=debug"]
+        assert api["ports"] == ["8000:8000"]
+        assert api["depends_on"] == ["db"]
+        assert "healthcheck" not in api
+    
+    def test_summary_flags_healthcheck_and_omitted_keys(self, tmp_path):
+        """Test that a healthcheck becomes a flag and other keys are listed by name."""
+        services = self._parse(tmp_path)
+        
+        assert services["api"]["has_healthcheck"] is True
+        assert services["api"]["omitted_keys"] == ["labels", "restart"]
+        assert services["db"] == {"image": "postgres:16"}
+    
+    def test_summary_truncates_long_values(self, tmp_path):
+        """Test that string values over 300 characters are cut."""
+        command = self._parse(tmp_path)["api"]["command"]
+        
+        assert command == "x" * 300 + "...[truncated]"
+    
+    @pytest.mark.parametrize("full", [True, "true"])
+    def test_full_returns_services_verbatim(self, tmp_path, full):
+        """Test that full=true returns the service definitions unchanged."""
+        services = self._parse(tmp_path, full=full)
+        
+        assert services == yaml.safe_load(self._COMPOSE)["services"]